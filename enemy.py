@@ -1,6 +1,7 @@
 """Enemy entity and related functionality."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import inspect
 import math
 import random
@@ -8,7 +9,7 @@ import random
 from hazards import Trap, LaserBeam, ThunderLine
 from projectile import Projectile
 import config
-from utils import Vec2, perp, cycle_gun
+from utils import Vec2, perp, cycle_gun, enemy_behavior_name
 from enemy_behaviors.base import Behavior
 from enemy_behaviors.chase import Chase
 from enemy_behaviors.ranged import Ranged
@@ -46,6 +47,12 @@ class Enemy:
     seed: float = 0.0
     ai: dict = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Behavior is fixed for the enemy's lifetime; resolve the name and the
+        # tint used by hit/death effects once at spawn.
+        self._behavior_name = enemy_behavior_name(self)
+        self._color = config.ENEMY_COLORS.get(self._behavior_name, (200, 200, 200))
+
 
 def _safe_dir(v: Vec2, fallback: Vec2 | None = None) -> Vec2:
     n = v.normalized()
@@ -974,45 +981,46 @@ def update_enemy(enemy: Enemy, player_pos: Vec2, state, dt: float, game, player_
         if int(enemy.ai.get("phase", 0)) != new_phase:
             enemy.ai["phase"] = new_phase
             enemy.attack_cd = min(enemy.attack_cd, 0.35)
-        
-        if enemy.behavior == "boss_thunder":
-            _update_boss_thunder(enemy, player_pos, state, dt, game, player_vel)
-            return
-        if enemy.behavior == "boss_laser":
-            _update_boss_laser(enemy, player_pos, state, dt, game, player_vel)
-            return
-        if enemy.behavior == "boss_trapmaster":
-            _update_boss_trapmaster(enemy, player_pos, state, dt, game, player_vel)
-            return
-        if enemy.behavior == "boss_swarmqueen":
-            _update_boss_swarmqueen(enemy, player_pos, state, dt, game, player_vel)
-            return
-        if enemy.behavior == "boss_brute":
-            _update_boss_brute(enemy, player_pos, state, dt, game, player_vel)
-            return
-        if enemy.behavior == "boss_abyss_gaze":
-            _update_boss_abyss_gaze(enemy, player_pos, state, dt, game, player_vel)
-            return
-        if enemy.behavior == "boss_womb_core":
-            _update_boss_womb_core(enemy, player_pos, state, dt, game, player_vel)
-            return
+
+        boss_update = _BOSS_UPDATES.get(enemy.behavior)
+        if boss_update is not None:
+            boss_update(enemy, player_pos, state, dt, game, player_vel)
     else:
         if hasattr(enemy.behavior, "update"):
             _dispatch_behavior_update(enemy.behavior, enemy, player_pos, state, dt, game, player_vel)
 
 
+_BOSS_UPDATES = {
+    "boss_thunder": _update_boss_thunder,
+    "boss_laser": _update_boss_laser,
+    "boss_trapmaster": _update_boss_trapmaster,
+    "boss_swarmqueen": _update_boss_swarmqueen,
+    "boss_brute": _update_boss_brute,
+    "boss_abyss_gaze": _update_boss_abyss_gaze,
+    "boss_womb_core": _update_boss_womb_core,
+}
+
+
+@lru_cache(maxsize=64)
+def _updater_params(func) -> tuple[bool, bool]:
+    """Whether `func` accepts ``game`` and ``player_vel`` keywords."""
+    params = inspect.signature(func).parameters
+    return "game" in params, "player_vel" in params
+
+
 def _dispatch_behavior_update(behavior_impl, enemy: Enemy, player_pos: Vec2, state, dt: float, game, player_vel: Vec2) -> None:
     """Call behavior.update with backward-compatible argument mapping."""
     updater = getattr(behavior_impl, "update", None)
     if not callable(updater):
         return
 
+    # Behaviors are shared singletons, so the signature probe is resolved once
+    # per update function rather than once per enemy per frame.
+    wants_game, wants_vel = _updater_params(getattr(updater, "__func__", updater))
     kwargs = {}
-    params = inspect.signature(updater).parameters
-
-    if "game" in params:
+    if wants_game:
         kwargs["game"] = game
-    if "player_vel" in params:
+    if wants_vel:
         kwargs["player_vel"] = player_vel
 
     updater(enemy, player_pos, state, dt, **kwargs)
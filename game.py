@@ -10,12 +10,12 @@ from pyglet import shapes
 pyglet.options["shadow_window"] = False
 
 import config
-from config import SCREEN_W, SCREEN_H, FPS, MAP_CIRCLE, ENEMY_COLORS
+from config import SCREEN_W, SCREEN_H, FPS, MAP_CIRCLE
 
 from map import Room
 from level import GameState as GameStateData, get_difficulty_mods, spawn_loot_on_enemy_death
 
-from utils import set_view_size, compute_room_radius, Vec2, clamp_to_map, enemy_behavior_name, iso_to_world, dist, point_segment_distance
+from utils import set_view_size, compute_room_radius, Vec2, clamp_to_map, iso_to_world, dist_sq, segment_point_dist2
 
 from visuals import Visuals, GroupCache
 from weapons import get_weapon_for_wave, get_effective_fire_rate
@@ -123,6 +123,10 @@ class Game(pyglet.window.Window):
         self._fixed_dt = self.balance.fixed_dt
         self._frame_dt_cap = self.balance.frame_dt_cap
         self._max_catchup_steps = self.balance.max_catchup_steps
+        # Hitbox radii depend only on behavior / projectile type and the
+        # balance table never changes at runtime, so resolve each one once.
+        self._enemy_radius_cache: dict[str, float] = {}
+        self._projectile_radius_cache: dict[str, float] = {}
         self._accumulator = 0.0
         self._render_time = 0.0
         self.advanced_fx = AdvancedFX(self.width, self.height)
@@ -380,20 +384,22 @@ class Game(pyglet.window.Window):
         if aim.length() <= 1e-6:
             aim = Vec2(1.0, 0.0)
 
-        muzzle = self.player.pos + aim * 14.0
+        muzzle = Vec2(self.player.pos.x + aim.x * 14.0, self.player.pos.y + aim.y * 14.0)
         dmg = int(config.ULTRA_DAMAGE_BASE + self._effective_player_damage() * config.ULTRA_DAMAGE_MULT)
         beam_thickness = float(config.ULTRA_BEAM_THICKNESS)
         beam_ttl = float(config.ULTRA_BEAM_TTL)
 
         def _hit_enemy(e, amount: int):
             e.hp -= int(amount)
-            behavior_name = enemy_behavior_name(e)
-            enemy_color = ENEMY_COLORS.get(behavior_name, (200, 200, 200))
+            behavior_name = e._behavior_name
+            enemy_color = e._color
             if self.particle_system:
-                self.particle_system.add_hit_particles(e.pos, enemy_color)
+                self.particle_system.queue_hit_particles(e.pos, enemy_color)
             if e.hp <= 0:
                 if e in s.enemies:
                     s.enemies.remove(e)
+                    if behavior_name.startswith("boss_"):
+                        s.boss_count -= 1
                 if self.visuals:
                     self.visuals.drop_enemy(e)
                 if self.particle_system:
@@ -417,8 +423,10 @@ class Game(pyglet.window.Window):
             if self.particle_system:
                 self.particle_system.add_laser_beam(start, end, color=beam.color)
             hit_r = float(thickness) * 0.5
+            sx, sy, ex, ey = start.x, start.y, end.x, end.y
             for e in list(s.enemies):
-                if point_segment_distance(e.pos, start, end) <= hit_r + self._enemy_radius(e):
+                reach = hit_r + self._enemy_radius(e)
+                if segment_point_dist2(e.pos.x, e.pos.y, sx, sy, ex, ey) <= reach * reach:
                     _hit_enemy(e, int(damage))
 
         # Cycle variants for built-in variety while preserving predictable control.
@@ -454,10 +462,10 @@ class Game(pyglet.window.Window):
             s.shake = max(s.shake, 14.0)
         else:
             # Shockwave + forward finisher beam.
-            blast_r = 160.0
+            blast_r2 = 160.0 * 160.0
             blast_dmg = int(dmg * 0.58)
             for e in list(s.enemies):
-                if dist(e.pos, self.player.pos) <= blast_r:
+                if dist_sq(e.pos, self.player.pos) <= blast_r2:
                     _hit_enemy(e, blast_dmg)
             if self.particle_system:
                 self.particle_system.add_powerup_collection(self.player.pos, (255, 220, 180))
@@ -492,14 +500,21 @@ class Game(pyglet.window.Window):
                 self.advanced_fx.trigger_dash(0.7)
 
     def _enemy_radius(self, enemy) -> float:
-        return self.balance.enemy_radius(enemy_behavior_name(enemy))
+        name = enemy._behavior_name
+        r = self._enemy_radius_cache.get(name)
+        if r is None:
+            r = self._enemy_radius_cache[name] = float(self.balance.enemy_radius(name))
+        return r
 
     def _player_radius(self) -> float:
         return self.balance.player_radius
 
     def _projectile_radius(self, projectile) -> float:
-        ptype = str(getattr(projectile, "projectile_type", "bullet"))
-        return self.balance.projectile_radius(ptype)
+        ptype = projectile.projectile_type
+        r = self._projectile_radius_cache.get(ptype)
+        if r is None:
+            r = self._projectile_radius_cache[ptype] = float(self.balance.projectile_radius(ptype))
+        return r
 
     @staticmethod
     def _ultra_variant_name(player) -> str:
@@ -707,7 +722,7 @@ class Game(pyglet.window.Window):
             hp_max = max(1, int(getattr(self.player, "max_hp", 100)))
             hp_ratio = max(0.0, min(1.0, float(getattr(self.player, "hp", hp_max)) / float(hp_max)))
         if getattr(self, "state", None):
-            boss_active = any(enemy_behavior_name(e).startswith("boss_") for e in getattr(self.state, "enemies", []))
+            boss_active = self.state.boss_count > 0
         self.advanced_fx.render(self._render_time, ci, hp_ratio=hp_ratio, boss_active=boss_active)
 
 
@@ -6,6 +6,13 @@ from pyglet import shapes
 from menu import UI_FONT_HEAD, UI_FONT_BODY, UI_FONT_META
 
 
+def _set_text(label, text: str) -> None:
+    # Assigning a label's text re-lays it out even when unchanged, and
+    # update_bars runs every frame while most readouts change rarely.
+    if label.text != text:
+        label.text = text
+
+
 class HUD:
     """In-game overlay showing HP, shield, wave info, status effects, and score."""
 
@@ -238,7 +245,7 @@ class HUD:
             int(80 + 155 * hp_frac),
             int(82 + 50 * hp_frac),
         )
-        self.hp_value_label.text = f"{hp_now}/{hp_cap}"
+        _set_text(self.hp_value_label, f"{hp_now}/{hp_cap}")
 
         # Shield bar
         shield_cap = 100
@@ -250,41 +257,42 @@ class HUD:
             int(122 + 88 * shield_frac),
             int(202 + 42 * shield_frac),
         )
-        self.shield_value_label.text = f"{shield_now}/{shield_cap}"
+        _set_text(self.shield_value_label, f"{shield_now}/{shield_cap}")
 
         # Wave label
-        self.wave_label.text = f"WAVE {int(state.wave):02d}"
+        _set_text(self.wave_label, f"WAVE {int(state.wave):02d}")
         combo_value = int(getattr(state, "enemy_combo_value", 0))
         combo_text = str(getattr(state, "enemy_combo_text", "")).strip()
         if combo_text:
-            self.meta_label.text = (
+            _set_text(
+                self.meta_label,
                 f"{str(getattr(state, 'difficulty', 'normal')).upper()}  "
                 f"T+{int(state.time):03d}s  "
-                f"CMB {combo_value}  {combo_text}"
+                f"CMB {combo_value}  {combo_text}",
             )
         else:
-            self.meta_label.text = f"{str(getattr(state, 'difficulty', 'normal')).upper()}  T+{int(state.time):03d}s"
+            _set_text(self.meta_label, f"{str(getattr(state, 'difficulty', 'normal')).upper()}  T+{int(state.time):03d}s")
 
         # Status text
         max_chars = self._status_max_chars
         if len(status_text) > max_chars:
             status_text = status_text[: max(3, max_chars - 3)].rstrip() + "..."
-        self.status_label.text = status_text
+        _set_text(self.status_label, status_text)
 
         # Score
         if score is not None:
-            self.score_value_label.text = f"{score.score:,}"
+            _set_text(self.score_value_label, f"{score.score:,}")
             if score.combo > 1.05:
-                self.combo_label.text = f"x{score.combo:.1f} COMBO"
+                _set_text(self.combo_label, f"x{score.combo:.1f} COMBO")
                 # Gold-orange pulsing as combo rises
                 intensity = min(1.0, (score.combo - 1.0) / (6.0 - 1.0))
                 g = int(200 - 80 * intensity)
                 self.combo_label.color = (255, g, 80, 230)
             else:
-                self.combo_label.text = ""
+                _set_text(self.combo_label, "")
         else:
-            self.score_value_label.text = "0"
-            self.combo_label.text = ""
+            _set_text(self.score_value_label, "0")
+            _set_text(self.combo_label, "")
 
     def draw(self) -> None:
         self.batch.draw()
@@ -39,6 +39,8 @@ class GameState:
     last_wave_clear: float = 0.0
     shake: float = 0.0
     max_enemies: int = 12  # Limit concurrent enemies
+    boss_count: int = 0  # Live bosses in `enemies`; kept by spawn_wave and the kill paths
+    vortex_acc: float = 0.0  # Fractional vortex damage carried between frames
     enemy_combo_value: int = 0
     enemy_combo_text: str = ""
 
@@ -74,6 +76,7 @@ def spawn_wave(state: GameState, center: Vec2):
         e.attack_cd = state.rng.uniform(lo, hi) / atk_cd_scale
         e.ai["attack_mult"] = float(attack_mult)
         state.enemies.append(e)
+        state.boss_count += 1
         state.enemy_combo_value = _SPAWN_LOGIC.boss_combo_value(behavior_name)
         state.enemy_combo_text = f"BOSS {behavior_name[5:].upper()}"
         return
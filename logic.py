@@ -86,6 +86,10 @@ class BalanceLogic:
     def fixed_dt(self) -> float:
         return 1.0 / max(1.0, float(self.fps))
 
+    @property
+    def max_enemy_radius(self) -> float:
+        return max(self.boss_radius, self.default_enemy_radius, *self.enemy_radii.values())
+
     def enemy_radius(self, behavior_name: str) -> float:
         b = str(behavior_name or "")
         if b.startswith("boss_"):
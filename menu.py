@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Optional
 import math
 import random
 import pyglet
-from pyglet import shapes
+from pyglet import gl, shapes
 import config
 from config import MAP_CIRCLE, MAP_DONUT, MAP_CROSS, MAP_DIAMOND
 from fonts import register_ui_fonts
@@ -27,7 +27,6 @@ def _ui_scale(width: int, height: int) -> float:
 
 def _sync_label_style_if_ready(label, font_name: str, font_size: int) -> None:
     """Avoid pyglet font style updates when GL context is temporarily unavailable."""
-    from pyglet import gl
     if getattr(gl, "current_context", None) is None:
         return
     if getattr(label, "font_name", None) != font_name:
@@ -58,11 +57,22 @@ class MenuButton:
     _bg: object = field(init=False, default=None, repr=False)
     _shine: object = field(init=False, default=None, repr=False)
     _label: object = field(init=False, default=None, repr=False)
+    _dirty: bool = field(init=False, default=True, repr=False)
     
     def contains_point(self, px: float, py: float) -> bool:
         """Check if point is inside button."""
         return self.x <= px <= self.x + self.width and self.y <= py <= self.y + self.height
 
+    def set_hovered(self, hovered: bool) -> None:
+        """Update hover state, flagging a re-sync only when it actually changes."""
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            self._dirty = True
+
+    def sync_if_dirty(self) -> None:
+        if self._dirty:
+            self.sync()
+
     def ensure(self, batch: pyglet.graphics.Batch) -> None:
         if self._batch is batch and self._bg is not None:
             return
@@ -88,6 +98,7 @@ class MenuButton:
     def sync(self) -> None:
         if self._bg is None:
             return
+        self._dirty = False
         color = self.hover_color if self.is_hovered else self.color
         shadow_off = max(2, int(self.height * 0.07))
         border_pad = max(2, int(self.height * 0.06))
@@ -117,7 +128,8 @@ class MenuButton:
         self._shine.height = shine_h
         self._shine.opacity = 70 if self.is_hovered else 24
 
-        self._label.text = self.text
+        if self._label.text != self.text:
+            self._label.text = self.text
         _sync_label_style_if_ready(self._label, self.font_name, int(self.font_size))
         self._label.x = self.x + self.width // 2
         self._label.y = self.y + self.height // 2
@@ -8,9 +8,15 @@ import pyglet
 from pyglet import shapes
 
 import config
-from utils import to_iso, Vec2
+from config import ISO_SCALE_X, ISO_SCALE_Y
+from utils import iso_origin, Vec2
 
-@dataclass
+# Particle budget is fixed for the process lifetime; resolve it once at import
+# instead of probing config on every emit() call.
+_SOFT_CAP = int(getattr(config, "PARTICLE_SOFT_CAP", 550))
+_HARD_CAP = int(getattr(config, "PARTICLE_HARD_CAP", 800))
+
+@dataclass(slots=True)
 class Particle:
     pos: Vec2
     vel: Vec2
@@ -29,6 +35,14 @@ class ParticleSystem:
         self.particles: list[Particle] = []
         self._shapes: list[shapes.Circle] = []
         self._last_active = 0
+        # Expired particles are parked here and reused by the emitters, so
+        # live + free never exceeds the peak particle count.
+        self._free: list[Particle] = []
+        # Hit sparks raised inside collision loops, emitted by the next update().
+        self._pending_hits: list[tuple[float, float, tuple[int, int, int]]] = []
+        self._pending_pos = Vec2(0.0, 0.0)
+        # emit() only reads a direction's angle, so reversed directions share one scratch vector.
+        self._back_dir = Vec2(0.0, 0.0)
         
     def emit(
         self,
@@ -45,8 +59,8 @@ class ParticleSystem:
     ):
         if count <= 0:
             return
-        soft_cap = int(getattr(config, "PARTICLE_SOFT_CAP", 550))
-        hard_cap = int(getattr(config, "PARTICLE_HARD_CAP", 800))
+        soft_cap = _SOFT_CAP
+        hard_cap = _HARD_CAP
         current = len(self.particles)
         if current >= hard_cap:
             return
@@ -61,27 +75,54 @@ class ParticleSystem:
             count = max(0, hard_cap - current)
             if count <= 0:
                 return
-        base_angle = 0.0
+        limit_angle = spread_angle if spread_angle is not None else spread
+
+        # Per-emit spawn ranges are shared by every particle in the burst;
+        # resolve them once instead of rebuilding them inside the loop.
         if direction:
             base_angle = math.atan2(direction.y, direction.x)
-        
-        limit_angle = spread_angle if spread_angle is not None else spread
+            ang_lo = base_angle - limit_angle * 0.5
+            ang_hi = base_angle + limit_angle * 0.5
+        else:
+            ang_lo = 0.0
+            ang_hi = limit_angle
+        sp_lo, sp_hi = speed * 0.5, speed * 1.5
+        life_lo, life_hi = life * 0.7, life * 1.3
+        size_lo, size_hi = size * 0.7, size * 1.3
+        px, py = pos.x, pos.y
+        uniform = random.uniform
+        cos, sin = math.cos, math.sin
+        append = self.particles.append
+        free = self._free
 
         for _ in range(count):
-            angle = base_angle + random.uniform(-limit_angle * 0.5, limit_angle * 0.5) if direction else random.uniform(0, limit_angle)
-            sp = random.uniform(speed * 0.5, speed * 1.5)
-            vel = Vec2(math.cos(angle) * sp, math.sin(angle) * sp)
-            life_val = random.uniform(life * 0.7, life * 1.3)
-            p = Particle(
-                pos=Vec2(pos.x, pos.y),
-                vel=vel,
-                life=life_val,
-                max_life=life_val,
-                color=color,
-                size=random.uniform(size * 0.7, size * 1.3),
-                decay=decay,
-            )
-            self.particles.append(p)
+            angle = uniform(ang_lo, ang_hi)
+            sp = uniform(sp_lo, sp_hi)
+            life_val = uniform(life_lo, life_hi)
+            if free:
+                p = free.pop()
+                pos_v = p.pos
+                pos_v.x = px
+                pos_v.y = py
+                vel_v = p.vel
+                vel_v.x = cos(angle) * sp
+                vel_v.y = sin(angle) * sp
+                p.life = life_val
+                p.max_life = life_val
+                p.color = color
+                p.size = uniform(size_lo, size_hi)
+                p.decay = decay
+                append(p)
+            else:
+                append(Particle(
+                    pos=Vec2(px, py),
+                    vel=Vec2(cos(angle) * sp, sin(angle) * sp),
+                    life=life_val,
+                    max_life=life_val,
+                    color=color,
+                    size=uniform(size_lo, size_hi),
+                    decay=decay,
+                ))
 
     def add_death_explosion(self, pos: Vec2, color: tuple[int, int, int], behavior_name: str = ""):
         count = 12
@@ -94,12 +135,19 @@ class ParticleSystem:
     def add_hit_particles(self, pos: Vec2, color: tuple[int, int, int]):
         self.emit(pos, color, count=4, speed=80.0, life=0.4, size=2.5)
 
+    def queue_hit_particles(self, pos: Vec2, color: tuple[int, int, int]):
+        """Deferred `add_hit_particles`: record the event, emit on the next update."""
+        self._pending_hits.append((pos.x, pos.y, color))
+
     def add_muzzle_flash(self, pos: Vec2, direction: Vec2):
         self.emit(pos, (255, 255, 200), count=6, speed=120.0, life=0.15, size=2.0, direction=direction, spread_angle=0.5)
 
     def add_step_dust(self, pos: Vec2, move_dir: Vec2):
         # Dust kicks up opposite to movement
-        self.emit(pos, (200, 200, 200), count=2, speed=30.0, life=0.3, size=2.0, direction=-move_dir, spread_angle=1.0)
+        back = self._back_dir
+        back.x = -move_dir.x
+        back.y = -move_dir.y
+        self.emit(pos, (200, 200, 200), count=2, speed=30.0, life=0.3, size=2.0, direction=back, spread_angle=1.0)
 
     def add_powerup_collection(self, pos: Vec2, color: tuple[int, int, int]):
         self.emit(pos, color, count=16, speed=120.0, life=0.8, size=3.5)
@@ -109,49 +157,93 @@ class ParticleSystem:
         self.emit(pos, (120, 210, 255), count=strength, speed=90.0, life=0.35, size=2.6)
 
     def add_dash_effect(self, pos: Vec2, dash_dir: Vec2):
-        back = -dash_dir
+        back = self._back_dir
+        back.x = -dash_dir.x
+        back.y = -dash_dir.y
         self.emit(pos, (160, 220, 255), count=8, speed=140.0, life=0.25, size=2.4, direction=back, spread_angle=0.4)
 
     def add_laser_beam(self, start: Vec2, end: Vec2, color: tuple[int, int, int]):
         # Emit particles along the line
-        d = dist(start, end)
-        steps = max(3, int(d / 15.0))
-        delta = (end - start) / float(steps)
-        curr = start
+        dx = end.x - start.x
+        dy = end.y - start.y
+        steps = max(3, int(math.hypot(dx, dy) / 15.0))
+        step_x = dx / steps
+        step_y = dy / steps
+        # emit() copies the position, so a single cursor can be walked along the beam.
+        curr = Vec2(start.x, start.y)
         for _ in range(steps):
             self.emit(curr, color, count=2, speed=40.0, life=0.3, size=2.0)
-            curr += delta
+            curr.x += step_x
+            curr.y += step_y
 
     def add_vortex_swirl(self, center: Vec2, time: float, radius: float):
         # Spiral particles
         angle = time * 4.0
-        offset = Vec2(math.cos(angle) * radius, math.sin(angle) * radius)
-        p = Particle(
-            pos=center + offset,
-            vel=-offset.normalized() * 50.0, # Suck in
-            life=0.4,
-            max_life=0.4,
-            color=(180, 140, 255),
-            size=3.0,
-            decay=False
-        )
+        c = math.cos(angle)
+        s = math.sin(angle)
+        x = center.x + c * radius
+        y = center.y + s * radius
+        pull = 50.0 if radius > 1e-9 else 0.0  # Suck in
+        vx = -c * pull
+        vy = -s * pull
+        if self._free:
+            # Reuse the pooled particle's own vectors rather than replacing them.
+            p = self._free.pop()
+            p.pos.x = x
+            p.pos.y = y
+            p.vel.x = vx
+            p.vel.y = vy
+            p.life = 0.4
+            p.max_life = 0.4
+            p.color = (180, 140, 255)
+            p.size = 3.0
+            p.decay = False
+        else:
+            p = Particle(
+                pos=Vec2(x, y),
+                vel=Vec2(vx, vy),
+                life=0.4,
+                max_life=0.4,
+                color=(180, 140, 255),
+                size=3.0,
+                decay=False
+            )
         self.particles.append(p)
     
-    def dist(self, a, b):
-         return math.sqrt((a.x-b.x)**2 + (a.y-b.y)**2)
-
     def update(self, dt: float):
+        pending = self._pending_hits
+        if pending:
+            # emit() copies the position, so one cursor serves every event.
+            cursor = self._pending_pos
+            for x, y, color in pending:
+                cursor.x = x
+                cursor.y = y
+                self.add_hit_particles(cursor, color)
+            pending.clear()
         if not self.particles:
             return
-        keep = []
-        for p in self.particles:
+        # Each particle owns its pos/vel vectors (emit copies them), so integrate
+        # in place and compact survivors to the front of the same list instead
+        # of allocating fresh vectors and a new list every frame.
+        particles = self.particles
+        release = self._free.append
+        damp = max(0.0, 1.0 - 2.0 * dt)
+        n = 0
+        for p in particles:
             p.life -= dt
             if p.life > 0:
-                p.pos = p.pos + p.vel * dt
+                pos = p.pos
+                vel = p.vel
+                pos.x += vel.x * dt
+                pos.y += vel.y * dt
                 if p.decay:
-                    p.vel = p.vel * max(0.0, 1.0 - 2.0 * dt)
-                keep.append(p)
-        self.particles = keep
+                    vel.x *= damp
+                    vel.y *= damp
+                particles[n] = p
+                n += 1
+            else:
+                release(p)
+        del particles[n:]
 
     def render(self, shake: Vec2):
         if not self.particles:
@@ -162,25 +254,29 @@ class ParticleSystem:
             return
         # Rebuild shapes pool if needed
         needed = len(self.particles)
+        prev_active = self._last_active
         self._last_active = needed
         if len(self._shapes) < needed:
             diff = needed - len(self._shapes)
             for _ in range(diff):
                 self._shapes.append(shapes.Circle(0, 0, 1, color=(255, 255, 255), batch=self.batch, group=self.group))
         
-        # Hide unused
-        for i in range(needed, len(self._shapes)):
-            self._shapes[i].opacity = 0
-
-        # Update active
-        for i, p in enumerate(self.particles):
-            sh = self._shapes[i]
-            sx, sy = to_iso(p.pos, shake)
-            sh.x, sh.y = sx, sy
-            ratio = max(0.0, p.life / p.max_life)
-            sh.radius = max(0.1, p.size * ratio)
-            sh.color = p.color
-            sh.opacity = max(0, min(255, int(255 * ratio)))
+        # Hide only the slots that were active last frame but are unused now.
+        shapes_pool = self._shapes
+        for i in range(needed, min(prev_active, len(shapes_pool))):
+            shapes_pool[i].opacity = 0
 
-def dist(a: Vec2, b: Vec2) -> float:
-    return (a - b).length()
+        # Update active: one position, one radius and one RGBA write per
+        # particle, so each shape pushes at most three vertex-attribute updates.
+        # The iso projection is inlined with the view centre and shake folded
+        # into a single per-frame origin.
+        ox, oy = iso_origin(shake)
+        for sh, p in zip(shapes_pool, self.particles):
+            pos = p.pos
+            x = pos.x
+            y = pos.y
+            sh.position = ((x - y) * ISO_SCALE_X + ox, (x + y) * ISO_SCALE_Y + oy)
+            ratio = p.life / p.max_life
+            sh.radius = max(0.1, p.size * ratio)
+            r, g, b = p.color
+            sh.color = (r, g, b, min(255, int(255 * ratio)))
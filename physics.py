@@ -1,7 +1,8 @@
 """Physics and collision detection logic."""
 
 from dataclasses import dataclass
-from typing import Protocol,runtime_checkable
+import math
+from typing import Callable, Protocol, runtime_checkable
 
 from utils import Vec2
 
@@ -15,26 +16,99 @@ def resolve_circle_obstacles(pos: Vec2, radius: float, obstacles: list[PhysicalE
 
     `obstacles` is expected to have `pos` and `radius` attributes.
     """
-    p = Vec2(pos.x, pos.y)
+    # Works on plain floats and rejects non-overlapping obstacles on squared
+    # distance, so the common no-contact case costs no sqrt and no Vec2.
+    px = pos.x
+    py = pos.y
     for _ in range(max(1, iterations)):
         moved = False
         for o in obstacles:
             op = o.pos
             r = radius + float(o.radius)
-            d = p - op
-            l = d.length()
-            if l >= r:
+            dx = px - op.x
+            dy = py - op.y
+            l2 = dx * dx + dy * dy
+            if l2 >= r * r:
                 continue
+            l = math.sqrt(l2)
             if l <= 1e-6:
                 # Nudge in a stable direction.
-                d = Vec2(1.0, 0.0)
+                dx = 1.0
+                dy = 0.0
                 l = 1.0
             push = (r - l) / l
-            p = Vec2(p.x + d.x * push, p.y + d.y * push)
+            px += dx * push
+            py += dy * push
             moved = True
         if not moved:
             break
-    return p
+    return Vec2(px, py)
+
+def resolve_and_clamp(pos: Vec2, radius: float, obstacles, clamp: Callable[[Vec2], Vec2]) -> Vec2:
+    """Push a circle out of `obstacles`, then keep it inside the map with `clamp`.
+
+    Single entry point for per-frame movement settling; with no obstacles this
+    is just the clamp.
+    """
+    if obstacles:
+        pos = resolve_circle_obstacles(pos, radius, obstacles)
+    return clamp(pos)
+
+class SpatialGrid:
+    """Uniform hash grid of circles for broad-phase proximity queries.
+
+    Each item is bucketed by its centre; queries widen their box by the
+    largest inserted radius so every circle that could touch it is returned.
+    """
+
+    __slots__ = ("inv_cell", "cells", "max_radius", "_count")
+
+    def __init__(self, cell_size: float):
+        self.inv_cell = 1.0 / float(cell_size)
+        self.cells: dict[tuple[int, int], list[tuple[int, object]]] = {}
+        self.max_radius = 0.0
+        self._count = 0
+
+    def insert(self, item, pos: Vec2, radius: float) -> None:
+        inv = self.inv_cell
+        key = (math.floor(pos.x * inv), math.floor(pos.y * inv))
+        entry = (self._count, item)
+        self._count += 1
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [entry]
+        else:
+            bucket.append(entry)
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def query_segment(self, a: Vec2, b: Vec2, pad: float) -> list:
+        """Items whose circle may come within `pad` of segment ab, in insertion order."""
+        r = pad + self.max_radius
+        inv = self.inv_cell
+        if a.x < b.x:
+            x0, x1 = a.x, b.x
+        else:
+            x0, x1 = b.x, a.x
+        if a.y < b.y:
+            y0, y1 = a.y, b.y
+        else:
+            y0, y1 = b.y, a.y
+        cx0 = math.floor((x0 - r) * inv)
+        cx1 = math.floor((x1 + r) * inv)
+        cy0 = math.floor((y0 - r) * inv)
+        cy1 = math.floor((y1 + r) * inv)
+        cells = self.cells
+        found: list[tuple[int, object]] = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        if len(found) > 1:
+            # Insertion indices are unique, so items themselves are never compared.
+            found.sort()
+        return [item for _, item in found]
 
 def check_circle_collision(pos1: Vec2, r1: float, pos2: Vec2, r2: float) -> bool:
     """Check if two circles overlap."""
@@ -1,9 +1,9 @@
 """PowerUp entity and related functionality."""
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
-from config import PLAYER_HP, ULTRA_MAX_CHARGES
+from config import ULTRA_MAX_CHARGES
 from utils import Vec2
 from weapons import WEAPONS
 
@@ -11,35 +11,81 @@ if TYPE_CHECKING:
     from player import Player
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUp:
     """PowerUp entity."""
     pos: Vec2
     kind: str  # "heal", "damage", "speed", "firerate", "shield", "laser", "vortex", "weapon", "ultra"
-    data: str | None = None
+    data: str | None = None  # weapon key for "weapon" pickups (already a lowercase WEAPONS key)
+
+
+# Pickup tuning.
+_HEAL_AMOUNT = 25
+_DAMAGE_BONUS = 4
+_SPEED_BONUS = 18
+_FIRE_RATE_DELTA = 0.03
+_FIRE_RATE_MIN = 0.16
+_SHIELD_ADD = 45
+_SHIELD_MAX = 120
+_LASER_DURATION = 8.0
+_VORTEX_DURATION = 10.0
+
+
+def _apply_heal(player: "Player", p: PowerUp, now: float) -> None:
+    player.hp = min(player.max_hp, player.hp + _HEAL_AMOUNT)
+
+
+def _apply_damage(player: "Player", p: PowerUp, now: float) -> None:
+    player.damage += _DAMAGE_BONUS
+
+
+def _apply_speed(player: "Player", p: PowerUp, now: float) -> None:
+    player.speed += _SPEED_BONUS
+
+
+def _apply_firerate(player: "Player", p: PowerUp, now: float) -> None:
+    player.fire_rate = max(_FIRE_RATE_MIN, player.fire_rate - _FIRE_RATE_DELTA)
+
+
+def _apply_shield(player: "Player", p: PowerUp, now: float) -> None:
+    player.shield = min(_SHIELD_MAX, player.shield + _SHIELD_ADD)
+
+
+def _apply_laser(player: "Player", p: PowerUp, now: float) -> None:
+    player.laser_until = max(player.laser_until, now + _LASER_DURATION)
+
+
+def _apply_vortex(player: "Player", p: PowerUp, now: float) -> None:
+    # A damaging aura that swirls around the player.
+    player.vortex_until = max(player.vortex_until, now + _VORTEX_DURATION)
+
+
+def _apply_weapon(player: "Player", p: PowerUp, now: float) -> None:
+    key = p.data or "basic"
+    if key in WEAPONS:
+        player.current_weapon = WEAPONS[key]
+
+
+def _apply_ultra(player: "Player", p: PowerUp, now: float) -> None:
+    player.ultra_charges = min(ULTRA_MAX_CHARGES, player.ultra_charges + 1)
+
+
+# Pickup handlers keyed by PowerUp.kind; unknown kinds are ignored.
+_POWERUP_HANDLERS: dict[str, Callable[["Player", PowerUp, float], None]] = {
+    "heal": _apply_heal,
+    "damage": _apply_damage,
+    "speed": _apply_speed,
+    "firerate": _apply_firerate,
+    "shield": _apply_shield,
+    "laser": _apply_laser,
+    "vortex": _apply_vortex,
+    "weapon": _apply_weapon,
+    "ultra": _apply_ultra,
+}
 
 
 def apply_powerup(player: "Player", p: PowerUp, now: float):
     """Apply a powerup effect to the player."""
-    if p.kind == "heal":
-        cap = int(getattr(player, "max_hp", PLAYER_HP))
-        player.hp = min(cap, player.hp + 25)
-    elif p.kind == "damage":
-        player.damage += 4
-    elif p.kind == "speed":
-        player.speed += 18
-    elif p.kind == "firerate":
-        player.fire_rate = max(0.16, player.fire_rate - 0.03)
-    elif p.kind == "shield":
-        player.shield = min(120, player.shield + 45)
-    elif p.kind == "laser":
-        player.laser_until = max(player.laser_until, now + 8.0)
-    elif p.kind == "vortex":
-        # A damaging aura that swirls around the player.
-        player.vortex_until = max(player.vortex_until, now + 10.0)
-    elif p.kind == "weapon":
-        key = str(p.data or "basic").lower()
-        if key in WEAPONS:
-            player.current_weapon = WEAPONS[key]
-    elif p.kind == "ultra":
-        player.ultra_charges = min(ULTRA_MAX_CHARGES, int(getattr(player, "ultra_charges", 0)) + 1)
+    handler = _POWERUP_HANDLERS.get(p.kind)
+    if handler is not None:
+        handler(player, p, now)
@@ -1,6 +1,7 @@
 ﻿"""Projectile entity and related functionality."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 import random
 from typing import TYPE_CHECKING
@@ -10,7 +11,7 @@ from utils import Vec2
 if TYPE_CHECKING:
     from weapons import Weapon
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """Projectile entity."""
     pos: Vec2
@@ -23,17 +24,80 @@ class Projectile:
 
     def update(self, dt: float) -> bool:
         """Update projectile position and TTL. Returns False if expired."""
-        self.prev_pos = self.pos
-        self.pos = self.pos + self.vel * dt
+        pos = self.pos
+        vel = self.vel
+        self.prev_pos = pos
+        self.pos = Vec2(pos.x + vel.x * dt, pos.y + vel.y * dt)
         self.ttl -= dt
         return self.ttl > 0
 
+def step_projectiles(projectiles: list[Projectile], dt: float) -> list[Projectile]:
+    """Advance every projectile by `dt` in a single pass.
+
+    Batch counterpart of `Projectile.update` for the per-frame simulation
+    loop: one call per frame instead of one method dispatch and one
+    temporary ``vel * dt`` vector per projectile.
+
+    Returns the projectiles whose TTL ran out this step (usually none), so
+    callers only visit those instead of re-scanning the whole list.
+    """
+    expired: list[Projectile] = []
+    for p in projectiles:
+        pos = p.pos
+        vel = p.vel
+        p.prev_pos = pos
+        p.pos = Vec2(pos.x + vel.x * dt, pos.y + vel.y * dt)
+        ttl = p.ttl - dt
+        p.ttl = ttl
+        if ttl <= 0:
+            expired.append(p)
+    return expired
+
+# Projectiles that left play, recycled by `_acquire_projectile` so sustained
+# fire reuses objects instead of allocating (and later collecting) new ones.
+_PROJECTILE_POOL: list[Projectile] = []
+_PROJECTILE_POOL_MAX = 512
+
+def _acquire_projectile(
+    pos: Vec2, vel: Vec2, damage: int, ttl: float, owner: str, ptype: str
+) -> Projectile:
+    """Return a projectile from the pool, or a new one if the pool is empty."""
+    if _PROJECTILE_POOL:
+        p = _PROJECTILE_POOL.pop()
+        p.pos = pos
+        p.vel = vel
+        p.damage = damage
+        p.ttl = ttl
+        p.owner = owner
+        p.projectile_type = ptype
+        p.prev_pos = None
+        return p
+    return Projectile(pos, vel, damage, ttl=ttl, owner=owner, projectile_type=ptype)
+
+def _release_projectile(p: Projectile) -> None:
+    """Return a projectile that has been removed from play to the pool."""
+    if len(_PROJECTILE_POOL) < _PROJECTILE_POOL_MAX:
+        _PROJECTILE_POOL.append(p)
+
 def _rotate_dir(aim: Vec2, angle_deg: float) -> Vec2:
     """Rotate aim direction by angle_deg degrees."""
     rad = math.radians(angle_deg)
     c, s = math.cos(rad), math.sin(rad)
     return Vec2(aim.x * c - aim.y * s, aim.x * s + aim.y * c)
 
+# Pellet lifetime for weapons that fire a fan of `projectile_count` shots.
+_FAN_TTL: dict[str, float] = {"bullet": 2.0, "spread": 2.2, "plasma": 2.5}
+
+@lru_cache(maxsize=64)
+def _spread_cossin(count: int, spread: float) -> tuple[tuple[float, float, float], ...]:
+    """Per-pellet ``(offset_deg, cos, sin)`` for a fan of `count` shots `spread` degrees apart."""
+    table = []
+    for i in range(count):
+        offset = (i - count / 2 + 0.5) * spread
+        rad = math.radians(offset)
+        table.append((offset, math.cos(rad), math.sin(rad)))
+    return tuple(table)
+
 def spawn_projectiles(
     muzzle: Vec2,
     aim_direction: Vec2,
@@ -42,61 +106,48 @@ def spawn_projectiles(
     base_damage: int,
     recoil_deg: float = 0.0,
     rng: random.Random | None = None,
+    out: list[Projectile] | None = None,
 ) -> list[Projectile]:
-    """Spawn projectiles based on weapon type."""
-    projectiles = []
+    """Spawn projectiles based on weapon type.
+
+    New projectiles are appended to `out` when given (typically the live
+    projectile list), which is then returned; otherwise a new list is.
+    """
+    projectiles = out if out is not None else []
     rng = rng or random
     
     # Weapon damage = weapon base damage + player damage bonus (50%)
     final_damage = weapon.damage + int(base_damage * 0.5)
 
     recoil = float(recoil_deg) if recoil_deg and recoil_deg > 0 else 0.0
+    ptype = weapon.projectile_type
     
-    if weapon.projectile_type == "bullet":
-        for i in range(weapon.projectile_count):
-            angle_offset = (i - weapon.projectile_count / 2 + 0.5) * weapon.spread_angle
-            jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
-            d = _rotate_dir(aim_direction, angle_offset + jitter)
-            vel = d * weapon.projectile_speed
-            projectiles.append(Projectile(
-                muzzle, vel, final_damage,
-                ttl=2.0, owner="player", projectile_type="bullet"
-            ))
-    
-    elif weapon.projectile_type == "spread":
-        for i in range(weapon.projectile_count):
-            angle_offset = (i - weapon.projectile_count / 2 + 0.5) * weapon.spread_angle
-            jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
-            d = _rotate_dir(aim_direction, angle_offset + jitter)
-            vel = d * weapon.projectile_speed
-            projectiles.append(Projectile(
-                muzzle, vel, final_damage,
-                ttl=2.2, owner="player", projectile_type="spread"
+    if ptype in _FAN_TTL:
+        # Fan offsets are fixed per weapon, so their rotations come from a cached
+        # table; only recoil jitter needs fresh trig per pellet.
+        ttl = _FAN_TTL[ptype]
+        speed = weapon.projectile_speed
+        ax, ay = aim_direction.x, aim_direction.y
+        append = projectiles.append
+        for offset, c, s in _spread_cossin(weapon.projectile_count, weapon.spread_angle):
+            if recoil:
+                rad = math.radians(offset + rng.uniform(-recoil, recoil))
+                c, s = math.cos(rad), math.sin(rad)
+            append(_acquire_projectile(
+                muzzle, Vec2((ax * c - ay * s) * speed, (ax * s + ay * c) * speed),
+                final_damage, ttl, "player", ptype,
             ))
     
-    elif weapon.projectile_type == "missile":
+    elif ptype == "missile":
         jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
         d = _rotate_dir(aim_direction, jitter) if jitter else aim_direction
         vel = d * weapon.projectile_speed
         muzzle_extended = muzzle + aim_direction * 4.0
-        projectiles.append(Projectile(muzzle_extended, vel, final_damage, ttl=3.0, owner="player", projectile_type="missile"))
-    
-    elif weapon.projectile_type == "plasma":
-        for i in range(weapon.projectile_count):
-            angle_offset = (i - weapon.projectile_count / 2 + 0.5) * weapon.spread_angle
-            jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
-            d = _rotate_dir(aim_direction, angle_offset + jitter)
-            vel = d * weapon.projectile_speed
-            projectiles.append(Projectile(muzzle, vel, final_damage, ttl=2.5, owner="player", projectile_type="plasma"))
+        projectiles.append(_acquire_projectile(muzzle_extended, vel, final_damage, 3.0, "player", "missile"))
     
-    elif weapon.projectile_type == "laser":
+    elif ptype == "laser":
         # Fast moving visual beam
         vel = aim_direction * 2000.0
-        projectiles.append(Projectile(
-            muzzle, vel, final_damage,
-            ttl=0.05, owner="player", projectile_type="laser"
-        ))
-    
-        return projectiles
+        projectiles.append(_acquire_projectile(muzzle, vel, final_damage, 0.05, "player", "laser"))
 
     return projectiles
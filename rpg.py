@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
 
 import pyglet
 from pyglet import shapes
@@ -24,25 +25,40 @@ if TYPE_CHECKING:
 # Reward pool definitions
 # ---------------------------------------------------------------------------
 
-TEMP_REWARD_POOL: list[dict] = [
-    {"key": "temp_overdrive", "title": "Overdrive", "desc": "+28% damage for 2 waves", "duration": 2},
-    {"key": "temp_haste", "title": "Haste Drive", "desc": "+22% move speed for 3 waves", "duration": 3},
-    {"key": "temp_rapidfire", "title": "Hot Trigger", "desc": "22% faster fire-rate for 2 waves", "duration": 2},
-    {"key": "temp_magnet", "title": "Magnet Core", "desc": "Wider pickup magnet for 3 waves", "duration": 3},
-    {"key": "temp_guard", "title": "Aegis Skin", "desc": "-18% incoming damage for 2 waves", "duration": 2},
-    {"key": "temp_ultra_flux", "title": "Ultra Flux", "desc": "Ultra cooldown reduced for 3 waves", "duration": 3},
-]
-
-PERM_REWARD_POOL: list[dict] = [
-    {"key": "perm_damage", "title": "Core Damage", "desc": "+1 damage this run"},
-    {"key": "perm_speed", "title": "Servo Boost", "desc": "+6 move speed this run"},
-    {"key": "perm_hp", "title": "Hull Plating", "desc": "+6 max HP this run"},
-    {"key": "perm_fire", "title": "Trigger Tuning", "desc": "Slightly faster shots this run"},
-    {"key": "perm_shield", "title": "Shield Layer", "desc": "+18 shield now"},
-    {"key": "perm_ultra", "title": "Ultra Charge", "desc": "+1 Ultra charge now"},
-    {"key": "perm_dash", "title": "Quick Dash", "desc": "Dash cooldown reduced this run"},
-    {"key": "perm_double_dash", "title": "Double Dash", "desc": "+1 dash charge this run"},
-]
+@dataclass(frozen=True, slots=True)
+class RewardOption:
+    """One boss reward card."""
+    key: str
+    title: str
+    desc: str
+    duration: int = 0  # waves; temp rewards only
+
+
+TEMP_REWARD_POOL: tuple[RewardOption, ...] = (
+    RewardOption("temp_overdrive", "Overdrive", "+28% damage for 2 waves", 2),
+    RewardOption("temp_haste", "Haste Drive", "+22% move speed for 3 waves", 3),
+    RewardOption("temp_rapidfire", "Hot Trigger", "22% faster fire-rate for 2 waves", 2),
+    RewardOption("temp_magnet", "Magnet Core", "Wider pickup magnet for 3 waves", 3),
+    RewardOption("temp_guard", "Aegis Skin", "-18% incoming damage for 2 waves", 2),
+    RewardOption("temp_ultra_flux", "Ultra Flux", "Ultra cooldown reduced for 3 waves", 3),
+)
+
+PERM_REWARD_POOL: tuple[RewardOption, ...] = (
+    RewardOption("perm_damage", "Core Damage", "+1 damage this run"),
+    RewardOption("perm_speed", "Servo Boost", "+6 move speed this run"),
+    RewardOption("perm_hp", "Hull Plating", "+6 max HP this run"),
+    RewardOption("perm_fire", "Trigger Tuning", "Slightly faster shots this run"),
+    RewardOption("perm_shield", "Shield Layer", "+18 shield now"),
+    RewardOption("perm_ultra", "Ultra Charge", "+1 Ultra charge now"),
+    RewardOption("perm_dash", "Quick Dash", "Dash cooldown reduced this run"),
+    RewardOption("perm_double_dash", "Double Dash", "+1 dash charge this run"),
+)
+
+# Pool order and key -> option lookups, so rolls filter plain key strings.
+_TEMP_REWARD_KEYS: tuple[str, ...] = tuple(x.key for x in TEMP_REWARD_POOL)
+_TEMP_REWARD_BY_KEY: dict[str, RewardOption] = {x.key: x for x in TEMP_REWARD_POOL}
+_PERM_REWARD_KEYS: tuple[str, ...] = tuple(x.key for x in PERM_REWARD_POOL)
+_PERM_REWARD_BY_KEY: dict[str, RewardOption] = {x.key: x for x in PERM_REWARD_POOL}
 
 TEMP_REWARD_NAMES: dict[str, str] = {
     "temp_overdrive": "Overdrive",
@@ -69,61 +85,124 @@ PERM_REWARD_NAMES: dict[str, str] = {
 # ---------------------------------------------------------------------------
 
 
+# Temp reward key -> (modifier, factor, bonus): modifier = modifier * factor + bonus.
+_TEMP_REWARD_MODS: dict[str, tuple[str, float, float]] = {
+    "temp_overdrive": ("damage", 1.28, 0.0),
+    "temp_haste": ("speed", 1.22, 0.0),
+    "temp_rapidfire": ("fire_rate", 0.78, 0.0),
+    "temp_magnet": ("magnet", 1.0, 80.0),
+    "temp_guard": ("incoming_damage", 0.82, 0.0),
+    "temp_ultra_flux": ("ultra_cd", 0.7, 0.0),
+}
+
+_NEUTRAL_TEMP_MODS: dict[str, float] = {
+    "damage": 1.0,
+    "speed": 1.0,
+    "fire_rate": 1.0,
+    "magnet": 0.0,
+    "incoming_damage": 1.0,
+    "ultra_cd": 1.0,
+}
+
+
 def recompute_temp_mods(active_temp_rewards: list[dict]) -> dict[str, float]:
     """Return a dict of computed modifier values from active temp rewards."""
-    dmg = 1.0
-    speed = 1.0
-    fire = 1.0
-    magnet = 0.0
-    incoming = 1.0
-    ultra_cd = 1.0
-    for fx in list(active_temp_rewards):
-        k = str(fx.get("key", ""))
-        if k == "temp_overdrive":
-            dmg *= 1.28
-        elif k == "temp_haste":
-            speed *= 1.22
-        elif k == "temp_rapidfire":
-            fire *= 0.78
-        elif k == "temp_magnet":
-            magnet += 80.0
-        elif k == "temp_guard":
-            incoming *= 0.82
-        elif k == "temp_ultra_flux":
-            ultra_cd *= 0.7
-    return {
-        "damage": dmg,
-        "speed": speed,
-        "fire_rate": fire,
-        "magnet": magnet,
-        "incoming_damage": incoming,
-        "ultra_cd": ultra_cd,
-    }
+    mods = _NEUTRAL_TEMP_MODS.copy()
+    if not active_temp_rewards:
+        return mods
+    for fx in active_temp_rewards:
+        mod = _TEMP_REWARD_MODS.get(fx["key"])
+        if mod is not None:
+            name, factor, bonus = mod
+            mods[name] = mods[name] * factor + bonus
+    return mods
 
 
 def advance_temp_rewards(active_list: list[dict]) -> list[dict]:
-    """Decrement wave counters and return kept rewards."""
-    kept: list[dict] = []
+    """Decrement wave counters and return kept rewards.
+
+    Expired entries are compacted out of `active_list` in place, and the same
+    list is returned."""
+    n = 0
     for fx in active_list:
-        left = int(fx.get("waves_left", 0)) - 1
+        left = fx["waves_left"] - 1
         if left > 0:
             fx["waves_left"] = left
-            kept.append(fx)
-    return kept
+            active_list[n] = fx
+            n += 1
+    del active_list[n:]
+    return active_list
 
 
 def apply_temp_reward(active_list: list[dict], key: str, duration: int) -> list[dict]:
-    """Add or refresh a temp reward in the active list, return updated list."""
-    k = str(key or "").strip().lower()
+    """Add or refresh a temp reward in the active list, return updated list.
+
+    `key` must already be normalized (lowercase, stripped) like the pool keys;
+    the game's pick handlers normalize it once before calling in."""
     dur = max(2, min(3, int(duration)))
     for fx in active_list:
-        if str(fx.get("key", "")) == k:
-            fx["waves_left"] = max(int(fx.get("waves_left", 0)), dur)
+        if fx["key"] == key:
+            fx["waves_left"] = max(fx["waves_left"], dur)
             return active_list
-    active_list.append({"key": k, "waves_left": dur})
+    # The only place entries are created; readers index both fields directly.
+    active_list.append({"key": key, "waves_left": dur})
     return active_list
 
 
+def _perm_damage(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.damage = int(player.damage) + 1
+    return dash_cd_mult
+
+
+def _perm_speed(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.speed = float(player.speed) + 6.0
+    return dash_cd_mult
+
+
+def _perm_hp(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.max_hp += 6
+    player.hp = min(int(player.max_hp), int(player.hp) + 6)
+    return dash_cd_mult
+
+
+def _perm_fire(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.fire_rate = max(0.12, float(player.fire_rate) - 0.006)
+    return dash_cd_mult
+
+
+def _perm_shield(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.shield = min(120, int(player.shield) + 18)
+    return dash_cd_mult
+
+
+def _perm_ultra(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.ultra_charges = min(ultra_max_charges, int(player.ultra_charges) + 1)
+    return dash_cd_mult
+
+
+def _perm_dash(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    return max(0.6, float(dash_cd_mult) * 0.90)
+
+
+def _perm_double_dash(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.dash_max_charges = min(2, player.dash_max_charges + 1)
+    player.dash_charges = int(player.dash_max_charges)
+    return dash_cd_mult
+
+
+# Permanent reward handlers keyed by reward key; each returns the updated dash_cd_mult.
+_PERM_REWARD_HANDLERS: dict[str, Callable[["Player", float, int], float]] = {
+    "perm_damage": _perm_damage,
+    "perm_speed": _perm_speed,
+    "perm_hp": _perm_hp,
+    "perm_fire": _perm_fire,
+    "perm_shield": _perm_shield,
+    "perm_ultra": _perm_ultra,
+    "perm_dash": _perm_dash,
+    "perm_double_dash": _perm_double_dash,
+}
+
+
 def apply_perm_reward(
     player: "Player",
     run_perms: list[str],
@@ -133,56 +212,39 @@ def apply_perm_reward(
 ) -> tuple[float, bool]:
     """Apply a permanent reward to the player.
 
-    Returns ``(updated_dash_cd_mult, applied)``."""
-    k = str(key or "").strip().lower()
-    applied = True
-    if k == "perm_damage":
-        player.damage = int(player.damage) + 1
-    elif k == "perm_speed":
-        player.speed = float(player.speed) + 6.0
-    elif k == "perm_hp":
-        player.max_hp = int(getattr(player, "max_hp", player.hp)) + 6
-        player.hp = min(int(player.max_hp), int(player.hp) + 6)
-    elif k == "perm_fire":
-        player.fire_rate = max(0.12, float(player.fire_rate) - 0.006)
-    elif k == "perm_shield":
-        player.shield = min(120, int(getattr(player, "shield", 0)) + 18)
-    elif k == "perm_ultra":
-        player.ultra_charges = min(ultra_max_charges, int(player.ultra_charges) + 1)
-    elif k == "perm_dash":
-        dash_cd_mult = max(0.6, float(dash_cd_mult) * 0.90)
-    elif k == "perm_double_dash":
-        player.dash_max_charges = min(2, int(getattr(player, "dash_max_charges", 1)) + 1)
-        player.dash_charges = int(player.dash_max_charges)
-    else:
-        applied = False
-
-    if applied and k not in run_perms:
-        run_perms.append(k)
-
-    return dash_cd_mult, applied
+    Returns ``(updated_dash_cd_mult, applied)``.
+
+    `key` is expected pre-normalized, as for `apply_temp_reward`."""
+    handler = _PERM_REWARD_HANDLERS.get(key)
+    if handler is None:
+        return dash_cd_mult, False
+
+    dash_cd_mult = handler(player, dash_cd_mult, ultra_max_charges)
+    if key not in run_perms:
+        run_perms.append(key)
+
+    return dash_cd_mult, True
 
 
 def roll_boss_rewards(
     active_temp_rewards: list[dict],
     last_temp_key: str,
     last_perm_key: str,
-) -> tuple[list[dict], list[dict]]:
+) -> tuple[list[RewardOption], list[RewardOption]]:
     """Pick 3 temp and 3 perm reward candidates. Returns (temp_opts, perm_opts)."""
-    active_temp = {str(x.get("key", "")) for x in active_temp_rewards}
-    temp_candidates = [
-        x for x in TEMP_REWARD_POOL
-        if x["key"] not in active_temp and x["key"] != last_temp_key
-    ]
-    if len(temp_candidates) < 3:
-        temp_candidates = [x for x in TEMP_REWARD_POOL if x["key"] not in active_temp] or list(TEMP_REWARD_POOL)
-
-    perm_candidates = [x for x in PERM_REWARD_POOL if x["key"] != last_perm_key]
-    if len(perm_candidates) < 3:
-        perm_candidates = list(PERM_REWARD_POOL)
-
-    temp_opts = random.sample(temp_candidates, k=min(3, len(temp_candidates)))
-    perm_opts = random.sample(perm_candidates, k=min(3, len(perm_candidates)))
+    # At most a couple of rewards are active, so a list scan beats building a set.
+    active_temp = [x["key"] for x in active_temp_rewards]
+    inactive = [k for k in _TEMP_REWARD_KEYS if k not in active_temp]
+    temp_keys = [k for k in inactive if k != last_temp_key]
+    if len(temp_keys) < 3:
+        temp_keys = inactive or _TEMP_REWARD_KEYS
+
+    perm_keys = [k for k in _PERM_REWARD_KEYS if k != last_perm_key]
+    if len(perm_keys) < 3:
+        perm_keys = _PERM_REWARD_KEYS
+
+    temp_opts = [_TEMP_REWARD_BY_KEY[k] for k in random.sample(temp_keys, k=min(3, len(temp_keys)))]
+    perm_opts = [_PERM_REWARD_BY_KEY[k] for k in random.sample(perm_keys, k=min(3, len(perm_keys)))]
     return temp_opts, perm_opts
 
 
@@ -192,10 +254,10 @@ def format_temp_hud(active_list: list[dict]) -> str:
         return ""
     parts: list[str] = []
     for fx in active_list[:2]:
-        key = str(fx.get("key", ""))
-        left = int(fx.get("waves_left", 0))
-        if key in TEMP_REWARD_NAMES and left > 0:
-            parts.append(f"{TEMP_REWARD_NAMES[key]}:{left}")
+        name = TEMP_REWARD_NAMES.get(fx["key"])
+        left = fx["waves_left"]
+        if name and left > 0:
+            parts.append(f"{name}:{left}")
     if not parts:
         return ""
     return "Temp " + ", ".join(parts)
@@ -214,6 +276,22 @@ def format_perm_hud(run_perms: list[str]) -> str:
     return "Run " + ",".join(shown)
 
 
+# Fills unused rows; its empty key makes the row unpickable.
+_EMPTY_REWARD_OPTION = RewardOption("", "--", "")
+
+# Shared by the three option rows; only the text differs per row.
+_REWARD_BUTTON_STYLE = dict(color=(36, 132, 186), hover_color=(86, 188, 236))
+_REWARD_DESC_STYLE = dict(
+    font_name=UI_FONT_META,
+    font_size=11,
+    x=0,
+    y=0,
+    anchor_x="left",
+    anchor_y="center",
+    color=(165, 175, 195, 255),
+)
+
+
 class BossRewardMenu:
     """Two-step reward menu shown after boss waves."""
 
@@ -268,35 +346,22 @@ class BossRewardMenu:
         )
 
         self.buttons: list[MenuButton] = [
-            MenuButton(0, 0, 300, 72, "Option 1", lambda: None, color=(36, 132, 186), hover_color=(86, 188, 236)),
-            MenuButton(0, 0, 300, 72, "Option 2", lambda: None, color=(36, 132, 186), hover_color=(86, 188, 236)),
-            MenuButton(0, 0, 300, 72, "Option 3", lambda: None, color=(36, 132, 186), hover_color=(86, 188, 236)),
+            MenuButton(0, 0, 300, 72, f"Option {i + 1}", lambda: None, **_REWARD_BUTTON_STYLE)
+            for i in range(3)
+        ]
+        self.desc_labels: list[pyglet.text.Label] = [
+            pyglet.text.Label("", batch=self.batch, **_REWARD_DESC_STYLE) for _ in range(3)
         ]
-        self.desc_labels: list[pyglet.text.Label] = []
-        for _ in range(3):
-            self.desc_labels.append(
-                pyglet.text.Label(
-                    "",
-                    font_name=UI_FONT_META,
-                    font_size=11,
-                    x=0,
-                    y=0,
-                    anchor_x="left",
-                    anchor_y="center",
-                    color=(165, 175, 195, 255),
-                    batch=self.batch,
-                )
-            )
 
         for b in self.buttons:
             b.ensure(self.batch)
 
-        self._temp_opts: list[dict] = []
-        self._perm_opts: list[dict] = []
+        self._temp_opts: list[RewardOption] = []
+        self._perm_opts: list[RewardOption] = []
         self._stage = "temp"
         self.resize(width, height)
 
-    def begin(self, temp_options: list[dict], perm_options: list[dict]) -> None:
+    def begin(self, temp_options: list[RewardOption], perm_options: list[RewardOption]) -> None:
         self._temp_opts = list(temp_options or [])[:3]
         self._perm_opts = list(perm_options or [])[:3]
         self._stage = "temp"
@@ -305,21 +370,31 @@ class BossRewardMenu:
 
     def _sync_stage_labels(self) -> None:
         if self._stage == "temp":
-            self.subtitle.text = "Pick 1 Temporary Card (2-3 waves)"
-            self.tip.text = "After this, you will pick 1 small permanent run boost."
+            subtitle = "Pick 1 Temporary Card (2-3 waves)"
+            tip = "After this, you will pick 1 small permanent run boost."
         else:
-            self.subtitle.text = "Pick 1 Permanent Run Boost"
-            self.tip.text = "Applies for the rest of this run."
+            subtitle = "Pick 1 Permanent Run Boost"
+            tip = "Applies for the rest of this run."
+        # Label.text assignment re-lays out the glyphs even when unchanged.
+        if self.subtitle.text != subtitle:
+            self.subtitle.text = subtitle
+        if self.tip.text != tip:
+            self.tip.text = tip
 
     def _sync_buttons(self) -> None:
         options = self._temp_opts if self._stage == "temp" else self._perm_opts
         while len(options) < 3:
-            options.append({"key": "", "title": "--", "desc": ""})
+            options.append(_EMPTY_REWARD_OPTION)
         for i in range(3):
             opt = options[i]
-            self.buttons[i].text = str(opt.get("title", "--"))
-            self.desc_labels[i].text = str(opt.get("desc", ""))
-            self.buttons[i].sync()
+            btn = self.buttons[i]
+            title = opt.title
+            if btn.text != title:
+                btn.text = title
+                btn.sync()
+            desc = opt.desc
+            if self.desc_labels[i].text != desc:
+                self.desc_labels[i].text = desc
 
     def resize(self, width: int, height: int):
         self.screen_width = width
@@ -335,16 +410,14 @@ class BossRewardMenu:
         panel_x = cx - panel_w // 2
         panel_y = cy - panel_h // 2
 
-        self._panel_border.x = panel_x - 3
-        self._panel_border.y = panel_y - 3
+        # One position write per panel rather than separate x/y updates.
+        self._panel_border.position = (panel_x - 3, panel_y - 3)
         self._panel_border.width = panel_w + 6
         self._panel_border.height = panel_h + 6
-        self._panel.x = panel_x
-        self._panel.y = panel_y
+        self._panel.position = (panel_x, panel_y)
         self._panel.width = panel_w
         self._panel.height = panel_h
-        self._panel_shine.x = panel_x + 4
-        self._panel_shine.y = panel_y + panel_h - max(8, int(22 * scale))
+        self._panel_shine.position = (panel_x + 4, panel_y + panel_h - max(8, int(22 * scale)))
         self._panel_shine.width = panel_w - 8
         self._panel_shine.height = max(6, int(14 * scale))
 
@@ -362,37 +435,56 @@ class BossRewardMenu:
         bh = int(78 * scale)
         gap = int(16 * scale)
         y0 = self.tip.y - int(54 * scale) - bh
+        # Same for every row; scale them once.
+        btn_font = max(12, int(17 * scale))
+        btn_x = cx - bw // 2
+        desc_x = btn_x + int(12 * scale)
+        desc_dy = int(bh * 0.28)
+        desc_font = max(9, int(11 * scale))
         for i, btn in enumerate(self.buttons):
             btn.width = bw
             btn.height = bh
-            btn.font_size = max(12, int(17 * scale))
-            btn.x = cx - bw // 2
+            btn.font_size = btn_font
+            btn.x = btn_x
             btn.y = y0 - i * (bh + gap)
             btn.sync()
-            self.desc_labels[i].x = btn.x + int(12 * scale)
-            self.desc_labels[i].y = btn.y + int(bh * 0.28)
-            _sync_label_style_if_ready(self.desc_labels[i], UI_FONT_META, max(9, int(11 * scale)))
+            desc = self.desc_labels[i]
+            desc.x = desc_x
+            desc.y = btn.y + desc_dy
+            _sync_label_style_if_ready(desc, UI_FONT_META, desc_font)
+        # Buttons only move here, so cache their hit rects for the mouse handlers.
+        self._button_rects = [(b.x, b.y, b.x + b.width, b.y + b.height) for b in self.buttons]
+        self._buttons_bbox = (
+            min(r[0] for r in self._button_rects),
+            min(r[1] for r in self._button_rects),
+            max(r[2] for r in self._button_rects),
+            max(r[3] for r in self._button_rects),
+        )
 
     def on_mouse_motion(self, x: float, y: float):
-        for btn in self.buttons:
-            btn.is_hovered = btn.contains_point(x, y)
-            btn.sync()
+        bx0, by0, bx1, by1 = self._buttons_bbox
+        if not (bx0 <= x <= bx1 and by0 <= y <= by1):
+            for btn in self.buttons:
+                btn.set_hovered(False)
+            return
+        for btn, (x0, y0, x1, y1) in zip(self.buttons, self._button_rects):
+            btn.set_hovered(x0 <= x <= x1 and y0 <= y <= y1)
 
     def on_mouse_press(self, x: float, y: float, button: int) -> Optional[str]:
         if button != pyglet.window.mouse.LEFT:
             return None
         options = self._temp_opts if self._stage == "temp" else self._perm_opts
-        for i, btn in enumerate(self.buttons):
-            if not btn.contains_point(x, y):
+        for i, (x0, y0, x1, y1) in enumerate(self._button_rects):
+            if not (x0 <= x <= x1 and y0 <= y <= y1):
                 continue
             if i >= len(options):
                 return None
             chosen = options[i]
-            key = str(chosen.get("key", "")).strip()
+            key = chosen.key
             if not key:
                 return None
             if self._stage == "temp":
-                duration = int(chosen.get("duration", 2))
+                duration = chosen.duration
                 self._on_pick_temp(key, duration)
                 self._stage = "perm"
                 self._sync_stage_labels()
@@ -403,6 +495,7 @@ class BossRewardMenu:
         return None
 
     def draw(self):
+        # Text/layout changes sync eagerly; only hover flips are deferred to here.
         for b in self.buttons:
-            b.sync()
+            b.sync_if_dirty()
         self.batch.draw()
@@ -5,24 +5,21 @@ import math
 from enum import Enum
 import pyglet
 
-from config import ENEMY_COLORS, POWERUP_COLORS
+from config import POWERUP_COLORS
 import config
 from utils import (
     Vec2,
-    clamp_to_map,
+    map_clamper,
     iso_to_world,
-    dist,
     dist_sq,
-    point_segment_distance,
-    point_segment_distance_sq,
-    enemy_behavior_name,
+    segment_point_dist2,
 )
-from physics import resolve_circle_obstacles
+from physics import SpatialGrid, resolve_and_clamp
 from level import spawn_wave, maybe_spawn_powerup, spawn_loot_on_enemy_death, get_difficulty_mods
 from enemy import update_enemy
 from powerup import apply_powerup
 from weapons import get_weapon_for_wave, get_effective_fire_rate
-from projectile import spawn_projectiles
+from projectile import _release_projectile, spawn_projectiles, step_projectiles
 from fsm import State
 from hazards import LaserBeam
 from player import perform_dash, recharge_dash, format_dash_hud
@@ -38,6 +35,20 @@ class GameStateName(str, Enum):
     BOSS_REWARD = "BossRewardState"
     GAME_OVER = "GameOverState"
 
+# Player shots test only nearby enemies once a wave is this dense; below it a
+# straight scan is cheaper than building the grid.
+_ENEMY_GRID_MIN = 12
+_ENEMY_GRID_CELL = 64.0
+
+# Dense layouts (mazes) also get static obstacle grids, built once per layout,
+# so each shot or moving body only tests the obstacles around it.
+_OBSTACLE_GRID_MIN = 16
+_OBSTACLE_GRID_CELL = 128.0
+
+# Above this many enemies the cosmetic vortex swirl is emitted every other
+# frame to leave the frame budget to gameplay.
+_VORTEX_FX_BUSY_ENEMIES = 20
+
 
 def _draw_playing_scene(game) -> None:
     if GameStateName.PLAYING.value in game.fsm._states:
@@ -121,6 +132,18 @@ class GuideState(State):
 
 
 class PlayingState(State):
+    # Flat (x, y, radius) rows for the current obstacle layout. The layout list
+    # is only ever replaced, never edited, so identity tells when to rebuild.
+    _obstacle_src = None
+    _obstacle_rows: tuple[tuple[float, float, float], ...] = ()
+    _obstacle_grid: SpatialGrid | None = None
+    _obstacle_body_grid: SpatialGrid | None = None
+    # Aim direction keyed by the mouse tuple and player position it came from;
+    # both are replaced (never mutated) when they change.
+    _aim_src: tuple = (None, None)
+    _aim_dir: Vec2 = Vec2(0.0, 0.0)
+    _vortex_fx_parity = 0
+
     def enter(self):
         if not self.game.state:
             self.game._init_game()
@@ -155,26 +178,83 @@ class PlayingState(State):
 
     @staticmethod
     def _remove_projectile(game, s, p) -> None:
+        game.visuals.drop_projectile(p)
         if p in s.projectiles:
             s.projectiles.remove(p)
-        game.visuals.drop_projectile(p)
+            # Only recycle once its visual (keyed by id) is gone.
+            _release_projectile(p)
 
     @staticmethod
-    def _is_enemy_bomb(p) -> bool:
-        return p.owner == "enemy" and str(getattr(p, "projectile_type", "bullet")) == "bomb"
+    def _discard_projectile(game, p) -> None:
+        """Drop and recycle a projectile the caller has already unlinked."""
+        game.visuals.drop_projectile(p)
+        _release_projectile(p)
 
     @staticmethod
-    def _segment_hits_circle(psd2, center: Vec2, prev: Vec2, pos: Vec2, hit_r2: float) -> bool:
-        return psd2(center, prev, pos) <= hit_r2
+    def _is_enemy_bomb(p) -> bool:
+        return p.owner == "enemy" and p.projectile_type == "bomb"
+
+    def _obstacle_circles(self, obstacles) -> tuple[tuple[float, float, float], ...]:
+        if obstacles is not self._obstacle_src:
+            self._obstacle_src = obstacles
+            self._obstacle_rows = tuple((float(ob.pos.x), float(ob.pos.y), float(ob.radius)) for ob in obstacles)
+            self._obstacle_grid = None
+            self._obstacle_body_grid = None
+            if len(self._obstacle_rows) >= _OBSTACLE_GRID_MIN:
+                grid = SpatialGrid(_OBSTACLE_GRID_CELL)
+                body_grid = SpatialGrid(_OBSTACLE_GRID_CELL)
+                for ob, row in zip(obstacles, self._obstacle_rows):
+                    grid.insert(row, ob.pos, row[2])
+                    body_grid.insert(ob, ob.pos, row[2])
+                self._obstacle_grid = grid
+                self._obstacle_body_grid = body_grid
+        return self._obstacle_rows
+
+    def _blocking_near(self, blocking, pos: Vec2, radius: float):
+        """Obstacles of `blocking` that a circle at `pos` can be pushed against."""
+        grid = self._obstacle_body_grid
+        if grid is None or not blocking:
+            return blocking
+        # A push carries the circle at most to the rim of the obstacle it
+        # overlaps, so anything it can touch afterwards is within this pad.
+        return grid.query_segment(pos, pos, 2.0 * radius + grid.max_radius)
 
     @staticmethod
-    def _projectile_hits_obstacle(psd2, prev: Vec2, pos: Vec2, pr: float, obstacles) -> bool:
-        for ob in obstacles:
-            hit_r2 = (float(ob.radius) + float(pr)) ** 2
-            if psd2(ob.pos, prev, pos) <= hit_r2:
+    def _projectile_hits_obstacle(prev: Vec2, pos: Vec2, pr: float, circles) -> bool:
+        # Same closest-point test as segment_point_dist2, with the segment
+        # terms hoisted out of the per-obstacle loop.
+        ax = prev.x
+        ay = prev.y
+        abx = pos.x - ax
+        aby = pos.y - ay
+        ab_len2 = abx * abx + aby * aby
+        inv_len2 = 1.0 / ab_len2 if ab_len2 > 1e-9 else 0.0
+        fpr = float(pr)
+        for ox, oy, orad in circles:
+            apx = ox - ax
+            apy = oy - ay
+            t = (apx * abx + apy * aby) * inv_len2
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            dx = apx - abx * t
+            dy = apy - aby * t
+            hit_r = orad + fpr
+            if dx * dx + dy * dy <= hit_r * hit_r:
                 return True
         return False
 
+    def _aim(self, game) -> Vec2:
+        """Unit vector from the player toward the mouse, shared by update and draw."""
+        mouse_xy = game.mouse_xy
+        pos = game.player.pos
+        src_mouse, src_pos = self._aim_src
+        if mouse_xy is not src_mouse or pos is not src_pos:
+            self._aim_src = (mouse_xy, pos)
+            self._aim_dir = (iso_to_world(mouse_xy) - pos).normalized()
+        return self._aim_dir
+
     def _explode_enemy_bomb(self, game, s, p) -> None:
         blast_r = game.balance.bomb_blast_radius
         blast_r2 = float(blast_r) * float(blast_r)
@@ -188,10 +268,12 @@ class PlayingState(State):
     @staticmethod
     def _kill_enemy(game, s, e, death_particles: bool = True) -> None:
         """Centralized enemy kill: visuals cleanup, particles, loot, and score."""
-        behavior_name = enemy_behavior_name(e)
-        enemy_color = ENEMY_COLORS.get(behavior_name, (200, 200, 200))
+        behavior_name = e._behavior_name
+        enemy_color = e._color
         if e in s.enemies:
             s.enemies.remove(e)
+            if behavior_name.startswith("boss_"):
+                s.boss_count -= 1
         if game.visuals:
             game.visuals.drop_enemy(e)
         if death_particles and game.particle_system:
@@ -204,92 +286,127 @@ class PlayingState(State):
         game = self.game
         if not game.state:
             return
+        player = game.player
+        balance = game.balance
         # Clamp unstable frame spikes for more consistent simulation behavior.
-        dt = max(0.0, min(float(dt), game.balance.sim_dt_cap))
+        dt = max(0.0, min(float(dt), balance.sim_dt_cap))
 
         s = game.state
         s.time += dt
-        if game.player.invincibility_timer > 0:
-            game.player.invincibility_timer -= dt
+        if player.invincibility_timer > 0:
+            player.invincibility_timer -= dt
 
-        if not s.wave_active and (s.time - s.last_wave_clear) >= game.balance.wave_cooldown:
+        if not s.wave_active and (s.time - s.last_wave_clear) >= balance.wave_cooldown:
             spawn_wave(s, Vec2(0.0, 0.0))
 
-        if s.time < game.player.vortex_until:
-            game.particle_system.add_vortex_swirl(game.player.pos, s.time, game.player.vortex_radius)
-            vortex_r2 = float(game.player.vortex_radius) * float(game.player.vortex_radius)
-            dps = game.player.vortex_dps
-            for e in list(s.enemies):
-                if dist_sq(e.pos, game.player.pos) <= vortex_r2:
-                    acc = getattr(e, "_vortex_acc", 0.0) + dps * dt
-                    dmg = int(acc)
-                    e._vortex_acc = acc - dmg
-                    if dmg > 0:
+        if s.time < player.vortex_until:
+            self._vortex_fx_parity ^= 1
+            if self._vortex_fx_parity or len(s.enemies) <= _VORTEX_FX_BUSY_ENEMIES:
+                game.particle_system.add_vortex_swirl(player.pos, s.time, player.vortex_radius)
+            # One shared accumulator turns vortex DPS into whole damage pulses;
+            # enemies are only scanned on frames where a pulse lands.
+            acc = s.vortex_acc + player.vortex_dps * dt
+            dmg = int(acc)
+            s.vortex_acc = acc - dmg
+            if dmg > 0:
+                vortex_r2 = float(player.vortex_radius) * float(player.vortex_radius)
+                px, py = player.pos.x, player.pos.y
+                # Kills are deferred past the scan so the list needs no copy.
+                dead = []
+                for e in s.enemies:
+                    dx = e.pos.x - px
+                    dy = e.pos.y - py
+                    if dx * dx + dy * dy <= vortex_r2:
                         e.hp -= dmg
                         s.shake = max(s.shake, 2.5)
                         if e.hp <= 0:
-                            self._kill_enemy(game, s, e, death_particles=False)
-
-        player_radius = game._player_radius()
-        for tr in list(getattr(s, "traps", [])):
-            tr.t += dt
-            tr.ttl -= dt
-            if tr.ttl <= 0:
-                s.traps.remove(tr)
-                game.visuals.drop_trap(tr)
-                continue
-            if tr.damage > 0 and tr.t >= tr.armed_delay:
-                hit_r = float(tr.radius) + float(player_radius)
-                if dist_sq(tr.pos, game.player.pos) <= hit_r * hit_r:
-                    game._damage_player(tr.damage)
-                    s.shake = max(s.shake, 10.0)
-                    s.traps.remove(tr)
+                            dead.append(e)
+                for e in dead:
+                    self._kill_enemy(game, s, e, death_particles=False)
+
+        player_radius = float(game._player_radius())
+        # Hazard and pickup loops never add to their own list, so survivors are
+        # compacted to the front in place (order kept) instead of iterating a
+        # copy and paying an O(n) remove() per expiry.
+        traps = s.traps
+        if traps:
+            n = 0
+            for tr in traps:
+                tr.t += dt
+                tr.ttl -= dt
+                if tr.ttl <= 0:
                     game.visuals.drop_trap(tr)
-
-        for th in list(getattr(s, "thunders", [])):
-            th.t += dt
-            if th.t >= th.warn and not th.hit_done:
-                hit_r = th.thickness * 0.6 + player_radius * 0.35
-                if point_segment_distance_sq(game.player.pos, th.start, th.end) <= hit_r * hit_r:
-                    th.hit_done = True
-                    game._damage_player(th.damage)
-                    s.shake = max(s.shake, 14.0)
-                    game.particle_system.add_laser_beam(th.start, th.end, color=th.color)
-            if th.t >= th.warn + th.ttl:
-                s.thunders.remove(th)
-                game.visuals.drop_thunder(th)
-
-        old_pos = Vec2(game.player.pos.x, game.player.pos.y)
-        if game.player.is_dashing:
-            game.player.pos += game.player.dash_direction * game.player.dash_speed * dt
-            game.player.dash_timer -= dt
-            if game.player.dash_timer <= 0:
-                game.player.is_dashing = False
+                    continue
+                if tr.damage > 0 and tr.t >= tr.armed_delay:
+                    hit_r = float(tr.radius) + player_radius
+                    if dist_sq(tr.pos, player.pos) <= hit_r * hit_r:
+                        game._damage_player(tr.damage)
+                        s.shake = max(s.shake, 10.0)
+                        game.visuals.drop_trap(tr)
+                        continue
+                traps[n] = tr
+                n += 1
+            del traps[n:]
+
+        thunders = s.thunders
+        if thunders:
+            n = 0
+            for th in thunders:
+                th.t += dt
+                if th.t >= th.warn and not th.hit_done:
+                    hit_r = th.thickness * 0.6 + player_radius * 0.35
+                    ppos, a, b = player.pos, th.start, th.end
+                    if segment_point_dist2(ppos.x, ppos.y, a.x, a.y, b.x, b.y) <= hit_r * hit_r:
+                        th.hit_done = True
+                        game._damage_player(th.damage)
+                        s.shake = max(s.shake, 14.0)
+                        game.particle_system.add_laser_beam(th.start, th.end, color=th.color)
+                if th.t >= th.warn + th.ttl:
+                    game.visuals.drop_thunder(th)
+                    continue
+                thunders[n] = th
+                n += 1
+            del thunders[n:]
+
+        old_x = player.pos.x
+        old_y = player.pos.y
+        if player.is_dashing:
+            step = player.dash_speed * dt
+            dash_dir = player.dash_direction
+            player.pos = Vec2(old_x + dash_dir.x * step, old_y + dash_dir.y * step)
+            player.dash_timer -= dt
+            if player.dash_timer <= 0:
+                player.is_dashing = False
         else:
             idir = game._input_dir()
-            if idir.length() > 0:
-                nd = idir.normalized()
-                game.player.pos = game.player.pos + nd * game._effective_player_speed() * dt
-                game.particle_system.add_step_dust(game.player.pos, nd)
+            ilen = idir.length()
+            if ilen > 0:
+                nd = Vec2(idir.x / ilen, idir.y / ilen)
+                step = game._effective_player_speed() * dt
+                player.pos = Vec2(old_x + nd.x * step, old_y + nd.y * step)
+                game.particle_system.add_step_dust(player.pos, nd)
 
         # Recharge dash charges
         recharge_dash(
-            game.player, s.time, game.balance,
+            player, s.time, balance,
             float(getattr(game, "_dash_cd_difficulty", 1.0)),
             float(getattr(game, "_dash_cd_mult", 1.0)),
         )
-        game.player.pos = clamp_to_map(game.player.pos, config.ROOM_RADIUS * 0.9, s.map_type)
-        if config.ENABLE_OBSTACLES and getattr(s, "obstacles", None):
-            game.player.pos = resolve_circle_obstacles(game.player.pos, player_radius, s.obstacles)
-            game.player.pos = clamp_to_map(game.player.pos, config.ROOM_RADIUS * 0.9, s.map_type)
+        blocking = s.obstacles if config.ENABLE_OBSTACLES else None
+        obstacles = self._obstacle_circles(blocking) if blocking else None
+        clamp_player = map_clamper(s.map_type, config.ROOM_RADIUS * 0.9)
+        near = self._blocking_near(blocking, player.pos, player_radius)
+        player.pos = resolve_and_clamp(player.pos, player_radius, near, clamp_player)
         if dt > 1e-6:
-            player_vel = (game.player.pos - old_pos) * (1.0 / dt)
+            inv_dt = 1.0 / dt
+            pos = player.pos
+            player_vel = Vec2((pos.x - old_x) * inv_dt, (pos.y - old_y) * inv_dt)
         else:
             player_vel = Vec2(0.0, 0.0)
 
-        weapon = game.player.current_weapon
-        if weapon and game.player.recoil > 0:
-            game.player.recoil = max(0.0, game.player.recoil - float(weapon.recoil_recover) * dt)
+        weapon = player.current_weapon
+        if weapon and player.recoil > 0:
+            player.recoil = max(0.0, player.recoil - float(weapon.recoil_recover) * dt)
 
         weapon_cd = get_effective_fire_rate(weapon, game._effective_player_fire_rate())
         if weapon and weapon.cadence_jitter:
@@ -297,127 +414,214 @@ class PlayingState(State):
             weapon_cd *= jitter
         weapon_cd = max(float(getattr(config, "FIRE_RATE_MIN", 0.06)), weapon_cd)
 
-        if game.auto_shoot and s.time >= float(game.player.next_shot_time):
-            world_mouse = iso_to_world(game.mouse_xy)
-            aim = (world_mouse - game.player.pos).normalized()
-            muzzle = game.player.pos + aim * 14.0
+        if game.auto_shoot and s.time >= float(player.next_shot_time):
+            aim = self._aim(game)
+            muzzle = Vec2(player.pos.x + aim.x * 14.0, player.pos.y + aim.y * 14.0)
 
-            if s.time < game.player.laser_until:
+            if s.time < player.laser_until:
                 beam_len = config.ROOM_RADIUS * 1.6
                 end = muzzle + aim * beam_len
                 dmg = int(game._effective_player_damage() * 0.9) + 14
                 beam = LaserBeam(start=muzzle, end=end, damage=dmg, thickness=12.0, ttl=0.08, owner="player")
                 s.lasers.append(beam)
                 game.particle_system.add_laser_beam(muzzle, end, color=beam.color)
-                for e in list(s.enemies):
-                    hit_r = (beam.thickness * 0.5) + game._enemy_radius(e)
-                    if point_segment_distance_sq(e.pos, muzzle, end) <= hit_r * hit_r:
+                mx, my, ex, ey = muzzle.x, muzzle.y, end.x, end.y
+                half_w = beam.thickness * 0.5
+                # Reject enemies outside the beam's padded bounding box with
+                # plain compares before the segment-distance test.
+                pad = half_w + balance.max_enemy_radius
+                lo_x, hi_x = min(mx, ex) - pad, max(mx, ex) + pad
+                lo_y, hi_y = min(my, ey) - pad, max(my, ey) + pad
+                dead = []
+                for e in s.enemies:
+                    x = e.pos.x
+                    y = e.pos.y
+                    if x < lo_x or x > hi_x or y < lo_y or y > hi_y:
+                        continue
+                    hit_r = half_w + game._enemy_radius(e)
+                    if segment_point_dist2(x, y, mx, my, ex, ey) <= hit_r * hit_r:
                         e.hp -= dmg
                         s.shake = max(s.shake, 4.0)
                         if e.hp <= 0:
-                            self._kill_enemy(game, s, e, death_particles=False)
+                            dead.append(e)
+                for e in dead:
+                    self._kill_enemy(game, s, e, death_particles=False)
             else:
-                game.player.recoil = min(float(weapon.recoil_max), float(game.player.recoil) + float(weapon.recoil_kick))
-                projectiles = spawn_projectiles(
+                player.recoil = min(float(weapon.recoil_max), float(player.recoil) + float(weapon.recoil_kick))
+                spawn_projectiles(
                     muzzle, aim, weapon, s.time, game._effective_player_damage(),
-                    recoil_deg=float(game.player.recoil),
+                    recoil_deg=float(player.recoil),
                     rng=s.rng,
+                    out=s.projectiles,
                 )
-                s.projectiles.extend(projectiles)
 
             game.particle_system.add_muzzle_flash(muzzle, aim)
-            game.player.last_shot = s.time
-            game.player.next_shot_time = s.time + weapon_cd
+            player.last_shot = s.time
+            player.next_shot_time = s.time + weapon_cd
 
+        # Enemy AI never moves the player, so its position is fixed for this pass.
+        player_pos = player.pos
+        px, py = player_pos.x, player_pos.y
+        clamp_enemy = map_clamper(s.map_type, config.ROOM_RADIUS * 0.96)
         for e in list(s.enemies):
-            update_enemy(e, game.player.pos, s, dt, game, player_vel=player_vel)
-            behavior_name = enemy_behavior_name(e)
-            e._behavior_name = behavior_name
-            e._radius = game.balance.enemy_radius(behavior_name)
-            e.pos = clamp_to_map(e.pos, config.ROOM_RADIUS * 0.96, s.map_type)
-            if config.ENABLE_OBSTACLES and getattr(s, "obstacles", None):
-                e.pos = resolve_circle_obstacles(e.pos, e._radius, s.obstacles)
-                e.pos = clamp_to_map(e.pos, config.ROOM_RADIUS * 0.96, s.map_type)
-            hit_r = float(e._radius) + float(player_radius)
-            if dist_sq(e.pos, game.player.pos) <= hit_r * hit_r:
-                game._damage_player(game.balance.enemy_contact_damage)
+            update_enemy(e, player_pos, s, dt, game, player_vel=player_vel)
+            e._radius = game._enemy_radius(e)
+            near = self._blocking_near(blocking, e.pos, e._radius)
+            e.pos = resolve_and_clamp(e.pos, e._radius, near, clamp_enemy)
+            hit_r = e._radius + player_radius
+            dx = e.pos.x - px
+            dy = e.pos.y - py
+            if dx * dx + dy * dy <= hit_r * hit_r:
+                game._damage_player(balance.enemy_contact_damage)
                 self._kill_enemy(game, s, e, death_particles=False)
                 s.shake = 9.0
 
-        psd2 = point_segment_distance_sq
         projectile_radius = game._projectile_radius
-        obstacles = s.obstacles if (config.ENABLE_OBSTACLES and getattr(s, "obstacles", None)) else None
+        obstacle_grid = self._obstacle_grid if obstacles else None
 
-        for p in list(s.projectiles):
-            p.update(dt)
+        expired = step_projectiles(s.projectiles, dt)
+        for p in expired:
+            # A final step that crosses an obstacle still sparks on it, as the
+            # obstacle test runs before expiry.
             if obstacles:
                 pr = projectile_radius(p)
-                prev = p.prev_pos or p.pos
-                if self._projectile_hits_obstacle(psd2, prev, p.pos, pr, obstacles):
+                p_prev = p.prev_pos or p.pos
+                if obstacle_grid is not None:
+                    rows = obstacle_grid.query_segment(p_prev, p.pos, pr)
+                else:
+                    rows = obstacles
+                if self._projectile_hits_obstacle(p_prev, p.pos, pr, rows):
+                    game.particle_system.queue_hit_particles(p.pos, (160, 160, 170))
+            if self._is_enemy_bomb(p):
+                self._explode_enemy_bomb(game, s, p)
+            self._remove_projectile(game, s, p)
+
+        enemy_grid = None
+        if len(s.enemies) >= _ENEMY_GRID_MIN:
+            enemy_grid = SpatialGrid(_ENEMY_GRID_CELL)
+            for e in s.enemies:
+                # Adds spawned mid-pass have no cached radius yet.
+                er = getattr(e, "_radius", None)
+                enemy_grid.insert(e, e.pos, er if er is not None else game._enemy_radius(e))
+
+        # One pass per projectile for obstacle blocking and hits. Nothing below
+        # spawns projectiles, so survivors are compacted in place rather than
+        # iterating a copy and removing spent shots one by one.
+        projectiles = s.projectiles
+        n = 0
+        for p in projectiles:
+            pr = projectile_radius(p)
+            p_prev = p.prev_pos or p.pos
+            if obstacles:
+                if obstacle_grid is not None:
+                    rows = obstacle_grid.query_segment(p_prev, p.pos, pr)
+                else:
+                    rows = obstacles
+                if self._projectile_hits_obstacle(p_prev, p.pos, pr, rows):
                     if self._is_enemy_bomb(p):
                         self._explode_enemy_bomb(game, s, p)
-                    self._remove_projectile(game, s, p)
-                    game.particle_system.add_hit_particles(p.pos, (160, 160, 170))
+                    game.particle_system.queue_hit_particles(p.pos, (160, 160, 170))
+                    self._discard_projectile(game, p)
                     continue
-            if p.ttl <= 0:
-                if self._is_enemy_bomb(p):
-                    self._explode_enemy_bomb(game, s, p)
-                self._remove_projectile(game, s, p)
-                continue
-
-        for p in list(s.projectiles):
-            pr = projectile_radius(p)
-            p_prev = p.prev_pos or p.pos
+            spent = False
             if p.owner == "player":
-                for e in list(s.enemies):
-                    er = getattr(e, "_radius", game._enemy_radius(e))
-                    hit_r2 = (float(pr) + float(er)) ** 2
-                    if self._segment_hits_circle(psd2, e.pos, p_prev, p.pos, hit_r2):
+                if enemy_grid is not None:
+                    targets = enemy_grid.query_segment(p_prev, p.pos, pr)
+                else:
+                    # Safe without a copy: the loop breaks right after a kill.
+                    targets = s.enemies
+                # The swept segment is shared by every candidate, so its terms
+                # are resolved once and each enemy costs only float arithmetic.
+                ax = p_prev.x
+                ay = p_prev.y
+                abx = p.pos.x - ax
+                aby = p.pos.y - ay
+                ab_len2 = abx * abx + aby * aby
+                inv_len2 = 1.0 / ab_len2 if ab_len2 > 1e-9 else 0.0
+                for e in targets:
+                    if e.hp <= 0:
+                        # Killed earlier this pass; the grid is not updated on removal.
+                        continue
+                    er = getattr(e, "_radius", None)
+                    if er is None:
+                        er = game._enemy_radius(e)
+                    epos = e.pos
+                    apx = epos.x - ax
+                    apy = epos.y - ay
+                    t = (apx * abx + apy * aby) * inv_len2
+                    if t < 0.0:
+                        t = 0.0
+                    elif t > 1.0:
+                        t = 1.0
+                    dx = apx - abx * t
+                    dy = apy - aby * t
+                    hit_r = pr + er
+                    if dx * dx + dy * dy <= hit_r * hit_r:
                         e.hp -= p.damage
                         s.shake = max(s.shake, 4.0)
 
-                        behavior_name = getattr(e, "_behavior_name", enemy_behavior_name(e))
-                        enemy_color = ENEMY_COLORS.get(behavior_name, (200, 200, 200))
-                        game.particle_system.add_hit_particles(e.pos, enemy_color)
+                        behavior_name = e._behavior_name
+                        game.particle_system.queue_hit_particles(e.pos, e._color)
 
                         if e.hp <= 0:
                             self._kill_enemy(game, s, e)
-                            if behavior_name == "tank" and dist(e.pos, game.player.pos) < game.balance.tank_death_blast_radius:
-                                game._damage_player(game.balance.tank_death_blast_damage)
+                            tank_r = balance.tank_death_blast_radius
+                            if behavior_name == "tank" and dist_sq(e.pos, player.pos) < tank_r * tank_r:
+                                game._damage_player(balance.tank_death_blast_damage)
                                 s.shake = 15.0
-                        self._remove_projectile(game, s, p)
+                        spent = True
                         break
             else:
-                ptype = str(getattr(p, "projectile_type", "bullet"))
-                hit_r2 = (float(pr) + float(player_radius)) ** 2
-                if ptype == "bomb":
-                    if self._segment_hits_circle(psd2, game.player.pos, p_prev, p.pos, hit_r2):
+                hit_r = pr + player_radius
+                if segment_point_dist2(px, py, p_prev.x, p_prev.y, p.pos.x, p.pos.y) <= hit_r * hit_r:
+                    if p.projectile_type == "bomb":
                         self._explode_enemy_bomb(game, s, p)
-                        self._remove_projectile(game, s, p)
-                elif self._segment_hits_circle(psd2, game.player.pos, p_prev, p.pos, hit_r2):
-                    game._damage_player(p.damage)
-                    s.shake = max(s.shake, 6.0)
-                    self._remove_projectile(game, s, p)
-
-        for pu in list(s.powerups):
-            dpu2 = dist_sq(pu.pos, game.player.pos)
-            kind = getattr(pu, "kind", "")
-            magnet_r = game.balance.pickup_magnet_radius(kind, game._pickup_magnet_bonus)
-            magnet_r2 = float(magnet_r) * float(magnet_r)
-            if 1e-12 < dpu2 < magnet_r2:
-                dpu = math.sqrt(dpu2)
-                pull = (game.player.pos - pu.pos).normalized()
-                pull_speed = game.balance.pickup_pull_speed(magnet_r, dpu)
-                pu.pos = pu.pos + pull * pull_speed * dt
-                dpu2 = dist_sq(pu.pos, game.player.pos)
-
-            pickup_r = game.balance.pickup_radius(kind)
-            if dpu2 < float(pickup_r) * float(pickup_r):
-                color = POWERUP_COLORS.get(pu.kind, (200, 200, 200))
-                game.particle_system.add_powerup_collection(pu.pos, color)
-                apply_powerup(game.player, pu, s.time)
-                s.powerups.remove(pu)
-                game.visuals.drop_powerup(pu)
+                    else:
+                        game._damage_player(p.damage)
+                        s.shake = max(s.shake, 6.0)
+                    spent = True
+            if spent:
+                self._discard_projectile(game, p)
+                continue
+            projectiles[n] = p
+            n += 1
+        del projectiles[n:]
+
+        powerups = s.powerups
+        if powerups:
+            # Magnet and pickup reach depend only on the kind; resolve each
+            # kind once per frame as (magnet_r, magnet_r2, pickup_r2).
+            reach_by_kind: dict[str, tuple[float, float, float]] = {}
+            px, py = player.pos.x, player.pos.y
+            n = 0
+            for pu in powerups:
+                kind = getattr(pu, "kind", "")
+                reach = reach_by_kind.get(kind)
+                if reach is None:
+                    magnet_r = float(balance.pickup_magnet_radius(kind, game._pickup_magnet_bonus))
+                    pickup_r = float(balance.pickup_radius(kind))
+                    reach = reach_by_kind[kind] = (magnet_r, magnet_r * magnet_r, pickup_r * pickup_r)
+                magnet_r, magnet_r2, pickup_r2 = reach
+                dx = px - pu.pos.x
+                dy = py - pu.pos.y
+                dpu2 = dx * dx + dy * dy
+                if 1e-12 < dpu2 < magnet_r2:
+                    dpu = math.sqrt(dpu2)
+                    step = balance.pickup_pull_speed(magnet_r, dpu) * dt / dpu
+                    pu.pos = Vec2(pu.pos.x + dx * step, pu.pos.y + dy * step)
+                    dx = px - pu.pos.x
+                    dy = py - pu.pos.y
+                    dpu2 = dx * dx + dy * dy
+
+                if dpu2 < pickup_r2:
+                    color = POWERUP_COLORS.get(pu.kind, (200, 200, 200))
+                    game.particle_system.add_powerup_collection(pu.pos, color)
+                    apply_powerup(player, pu, s.time)
+                    game.visuals.drop_powerup(pu)
+                    continue
+                powerups[n] = pu
+                n += 1
+            del powerups[n:]
 
         if s.wave_active and not s.enemies:
             cleared_wave = int(s.wave)
@@ -428,7 +632,7 @@ class PlayingState(State):
             new_segment = (s.wave - 1) // 5
             if config.ENABLE_OBSTACLES and new_segment != getattr(s, "layout_segment", 0):
                 game._regen_layout(new_segment)
-            game.player.current_weapon = get_weapon_for_wave(s.wave)
+            player.current_weapon = get_weapon_for_wave(s.wave)
             maybe_spawn_powerup(s, Vec2(0.0, 0.0))
 
             if cleared_wave % 5 == 0:
@@ -446,33 +650,36 @@ class PlayingState(State):
         if game.room:
             # Compute combat intensity from game state.
             n_enemies = len(s.enemies)
-            has_boss = any(
-                str(getattr(e, "behavior", "")).startswith("boss_")
-                for e in s.enemies
-            )
             if n_enemies == 0:
                 ci = 0.0
-            elif has_boss:
+            elif s.boss_count > 0:
                 ci = 0.8 + 0.2 * min(1.0, n_enemies / 4.0)
             else:
                 ci = min(0.55, 0.08 * n_enemies)
             game.room.set_combat_intensity(ci)
             game.room.update(dt)
 
-        for lb in list(getattr(s, "lasers", [])):
-            lb.t += dt
-            if lb.owner == "enemy" and lb.t >= lb.warn and not lb.hit_done:
-                hit_r = lb.thickness * 0.55 + player_radius * 0.35
-                if point_segment_distance_sq(game.player.pos, lb.start, lb.end) <= hit_r * hit_r:
-                    lb.hit_done = True
-                    game._damage_player(lb.damage)
-                    s.shake = max(s.shake, 10.0)
-                    game.particle_system.add_laser_beam(lb.start, lb.end, color=lb.color)
-            if lb.t >= lb.warn + lb.ttl:
-                s.lasers.remove(lb)
-                game.visuals.drop_laser(lb)
-
-        if game.player.hp <= 0:
+        lasers = s.lasers
+        if lasers:
+            n = 0
+            for lb in lasers:
+                lb.t += dt
+                if lb.owner == "enemy" and lb.t >= lb.warn and not lb.hit_done:
+                    hit_r = lb.thickness * 0.55 + player_radius * 0.35
+                    ppos, a, b = player.pos, lb.start, lb.end
+                    if segment_point_dist2(ppos.x, ppos.y, a.x, a.y, b.x, b.y) <= hit_r * hit_r:
+                        lb.hit_done = True
+                        game._damage_player(lb.damage)
+                        s.shake = max(s.shake, 10.0)
+                        game.particle_system.add_laser_beam(lb.start, lb.end, color=lb.color)
+                if lb.t >= lb.warn + lb.ttl:
+                    game.visuals.drop_laser(lb)
+                    continue
+                lasers[n] = lb
+                n += 1
+            del lasers[n:]
+
+        if player.hp <= 0:
             game.fsm.set_state(GameStateName.GAME_OVER)
 
     def draw(self):
@@ -492,30 +699,22 @@ class PlayingState(State):
                 game.visuals.ensure_obstacle(ob)
                 game.visuals.sync_obstacle(ob, shake)
 
-        aim_dir = (iso_to_world(game.mouse_xy) - game.player.pos).normalized()
+        aim_dir = self._aim(game)
         game.visuals.sync_player(game.player, shake, t=s.time, aim_dir=aim_dir)
 
-        for e in game.state.enemies:
-            game.visuals.ensure_enemy(e)
-            game.visuals.sync_enemy(e, shake)
-
-        for p in game.state.projectiles:
-            game.visuals.ensure_projectile(p)
-            game.visuals.sync_projectile(p, shake)
-
-        for pu in game.state.powerups:
-            game.visuals.ensure_powerup(pu)
-            game.visuals.sync_powerup(pu, shake)
+        game.visuals.sync_enemies(s.enemies, shake)
+        game.visuals.sync_projectiles(s.projectiles, shake)
+        game.visuals.sync_powerups(s.powerups, shake)
 
-        for tr in getattr(game.state, "traps", []):
+        for tr in s.traps:
             game.visuals.ensure_trap(tr)
             game.visuals.sync_trap(tr, shake)
 
-        for lb in getattr(game.state, "lasers", []):
+        for lb in s.lasers:
             game.visuals.ensure_laser(lb)
             game.visuals.sync_laser(lb, shake)
 
-        for th in getattr(game.state, "thunders", []):
+        for th in s.thunders:
             game.visuals.ensure_thunder(th)
             game.visuals.sync_thunder(th, shake)
 
@@ -534,10 +733,12 @@ class PlayingState(State):
             ultra_txt = f"Ultra {ultra_charges} [{game._ultra_variant_name(game.player)}]"
             if ultra_cd > 0:
                 ultra_txt += f" {ultra_cd:.0f}s"
-        boss = next((e for e in game.state.enemies if enemy_behavior_name(e).startswith("boss_")), None)
+        boss = None
+        if game.state.boss_count > 0:
+            boss = next((e for e in game.state.enemies if e._behavior_name.startswith("boss_")), None)
         boss_txt = ""
         if boss:
-            boss_name = enemy_behavior_name(boss)
+            boss_name = boss._behavior_name
             boss_txt = f"BOSS {boss_name[5:].replace('_', ' ').title()} HP {boss.hp}"
         
         dash_txt = format_dash_hud(game.player, game.state.time)
@@ -20,7 +20,6 @@ from config import (
     MAP_CROSS,
     MAP_DIAMOND,
     POWERUP_COLORS,
-    ENEMY_COLORS,
 )
 from enemy import update_enemy
 from hazards import LaserBeam
@@ -33,7 +32,7 @@ from level import (
     get_difficulty_mods,
 )
 from logic import BalanceLogic
-from physics import resolve_circle_obstacles
+from physics import resolve_and_clamp
 from player import Player, perform_dash, recharge_dash, format_dash_hud
 from powerup import apply_powerup
 from particles import ParticleSystem
@@ -46,18 +45,16 @@ from rpg import (
     roll_boss_rewards as rpg_roll_rewards,
     format_temp_hud,
     format_perm_hud,
+    RewardOption,
 )
 from score import ScoreTracker
 from utils import (
     Vec2,
-    clamp_to_map,
+    map_clamper,
     compute_room_radius,
-    dist,
     dist_sq,
-    enemy_behavior_name,
     iso_to_world,
-    point_segment_distance,
-    point_segment_distance_sq,
+    segment_point_dist2,
     set_view_size,
     to_iso,
 )
@@ -144,10 +141,12 @@ class BrowserGame:
             "map_type": MAP_CIRCLE,
         }
 
-        self.reward_temp_options: list[dict] = []
-        self.reward_perm_options: list[dict] = []
+        self.reward_temp_options: list[RewardOption] = []
+        self.reward_perm_options: list[RewardOption] = []
         self.reward_step = "temp"
         self.reward_message = ""
+        # (text, max_width, font) -> wrapped lines; see _wrap_text.
+        self._wrap_cache: dict[tuple[str, float, str], list[str]] = {}
         self.final_score = 0
         self.final_wave = 0
         self.high_score = 0
@@ -268,7 +267,7 @@ class BrowserGame:
         for idx, option in enumerate(options):
             self.reward_buttons.append(
                 UIButton(
-                    option["title"],
+                    option.title,
                     start_x + idx * (width + gap),
                     y,
                     width,
@@ -411,7 +410,7 @@ class BrowserGame:
         )
 
     def _enemy_radius(self, enemy) -> float:
-        return self.balance.enemy_radius(enemy_behavior_name(enemy))
+        return self.balance.enemy_radius(enemy._behavior_name)
 
     def _player_radius(self) -> float:
         return self.balance.player_radius
@@ -450,7 +449,7 @@ class BrowserGame:
         if aim.length() <= 1e-6:
             aim = Vec2(1.0, 0.0)
 
-        muzzle = self.player.pos + aim * 14.0
+        muzzle = Vec2(self.player.pos.x + aim.x * 14.0, self.player.pos.y + aim.y * 14.0)
         dmg = int(config.ULTRA_DAMAGE_BASE + self._effective_player_damage() * config.ULTRA_DAMAGE_MULT)
         beam_thickness = float(config.ULTRA_BEAM_THICKNESS)
         beam_ttl = float(config.ULTRA_BEAM_TTL)
@@ -473,8 +472,10 @@ class BrowserGame:
             )
             self.state.lasers.append(beam)
             hit_r = float(thickness) * 0.5
+            sx, sy, ex, ey = start.x, start.y, end.x, end.y
             for enemy_obj in list(self.state.enemies):
-                if point_segment_distance(enemy_obj.pos, start, end) <= hit_r + self._enemy_radius(enemy_obj):
+                reach = hit_r + self._enemy_radius(enemy_obj)
+                if segment_point_dist2(enemy_obj.pos.x, enemy_obj.pos.y, sx, sy, ex, ey) <= reach * reach:
                     hit_enemy(enemy_obj, int(damage))
 
         variant = int(getattr(self.player, "ultra_variant_idx", 0)) % 3
@@ -490,9 +491,9 @@ class BrowserGame:
                 direction = Vec2(aim.x * c - aim.y * s, aim.x * s + aim.y * c).normalized()
                 spawn_beam(muzzle, direction, config.ROOM_RADIUS * 1.9, int(dmg * 0.72), beam_thickness * 0.8, (255, 180, 180))
         else:
-            blast_r = 160.0
+            blast_r2 = 160.0 * 160.0
             for enemy_obj in list(self.state.enemies):
-                if dist(enemy_obj.pos, self.player.pos) <= blast_r:
+                if dist_sq(enemy_obj.pos, self.player.pos) <= blast_r2:
                     hit_enemy(enemy_obj, int(dmg * 0.58))
             spawn_beam(muzzle, aim, config.ROOM_RADIUS * 1.55, int(dmg * 0.62), beam_thickness * 0.7, (255, 210, 120))
 
@@ -524,11 +525,13 @@ class BrowserGame:
     def _kill_enemy(self, enemy_obj) -> None:
         if not self.state:
             return
-        behavior = enemy_behavior_name(enemy_obj)
+        behavior = enemy_obj._behavior_name
         if enemy_obj in self.state.enemies:
             self.state.enemies.remove(enemy_obj)
+            if behavior.startswith("boss_"):
+                self.state.boss_count -= 1
         spawn_loot_on_enemy_death(self.state, behavior, enemy_obj.pos)
-        self.particles.add_death_explosion(enemy_obj.pos, ENEMY_COLORS.get(behavior, (220, 220, 220)), behavior)
+        self.particles.add_death_explosion(enemy_obj.pos, enemy_obj._color, behavior)
         self.score.on_enemy_kill(behavior)
         self.impact = max(self.impact, 0.32)
 
@@ -542,14 +545,15 @@ class BrowserGame:
             self.state.shake = max(self.state.shake, 12.0)
 
     def _projectile_hits_obstacle(self, prev: Vec2, pos: Vec2, radius: float, obstacles) -> bool:
+        ax, ay, bx, by = prev.x, prev.y, pos.x, pos.y
         for obstacle in obstacles:
-            hit_r2 = (float(obstacle.radius) + float(radius)) ** 2
-            if point_segment_distance_sq(obstacle.pos, prev, pos) <= hit_r2:
+            hit_r = float(obstacle.radius) + float(radius)
+            if segment_point_dist2(obstacle.pos.x, obstacle.pos.y, ax, ay, bx, by) <= hit_r * hit_r:
                 return True
         return False
 
     def _segment_hits_circle(self, center: Vec2, prev: Vec2, pos: Vec2, hit_r2: float) -> bool:
-        return point_segment_distance_sq(center, prev, pos) <= hit_r2
+        return segment_point_dist2(center.x, center.y, prev.x, prev.y, pos.x, pos.y) <= hit_r2
 
     def _start_game(self) -> None:
         difficulty = str(self.settings.get("difficulty", "normal")).lower()
@@ -641,15 +645,16 @@ class BrowserGame:
             self._wave_banner_t = 1.5
 
         if s.time < self.player.vortex_until:
-            vortex_r2 = float(self.player.vortex_radius) ** 2
-            dps = float(self.player.vortex_dps)
             self.particles.add_vortex_swirl(self.player.pos, s.time, float(self.player.vortex_radius))
-            for enemy_obj in list(s.enemies):
-                if dist_sq(enemy_obj.pos, self.player.pos) <= vortex_r2:
-                    acc = getattr(enemy_obj, "_vortex_acc", 0.0) + dps * dt
-                    dmg = int(acc)
-                    enemy_obj._vortex_acc = acc - dmg
-                    if dmg > 0:
+            # One shared accumulator turns vortex DPS into whole damage pulses;
+            # enemies are only scanned on frames where a pulse lands.
+            acc = s.vortex_acc + float(self.player.vortex_dps) * dt
+            dmg = int(acc)
+            s.vortex_acc = acc - dmg
+            if dmg > 0:
+                vortex_r2 = float(self.player.vortex_radius) ** 2
+                for enemy_obj in list(s.enemies):
+                    if dist_sq(enemy_obj.pos, self.player.pos) <= vortex_r2:
                         enemy_obj.hp -= dmg
                         if enemy_obj.hp <= 0:
                             self._kill_enemy(enemy_obj)
@@ -673,14 +678,16 @@ class BrowserGame:
             thunder.t += dt
             if thunder.t >= thunder.warn and not thunder.hit_done:
                 hit_r = thunder.thickness * 0.6 + player_radius * 0.35
-                if point_segment_distance_sq(self.player.pos, thunder.start, thunder.end) <= hit_r * hit_r:
+                ppos, a, b = self.player.pos, thunder.start, thunder.end
+                if segment_point_dist2(ppos.x, ppos.y, a.x, a.y, b.x, b.y) <= hit_r * hit_r:
                     thunder.hit_done = True
                     self._damage_player(thunder.damage)
                     s.shake = max(s.shake, 14.0)
             if thunder.t >= thunder.warn + thunder.ttl:
                 s.thunders.remove(thunder)
 
-        old_pos = Vec2(self.player.pos.x, self.player.pos.y)
+        old_x = self.player.pos.x
+        old_y = self.player.pos.y
         if self.player.is_dashing:
             self.player.pos += self.player.dash_direction * self.player.dash_speed * dt
             self.player.dash_timer -= dt
@@ -697,13 +704,14 @@ class BrowserGame:
         recharge_dash(self.player, s.time, self.balance, self._dash_cd_difficulty, self._dash_cd_mult)
         if self.player.is_dashing:
             self.particles.add_dash_effect(self.player.pos, self.player.dash_direction)
-        self.player.pos = clamp_to_map(self.player.pos, config.ROOM_RADIUS * 0.9, s.map_type)
-        if config.ENABLE_OBSTACLES and getattr(s, "obstacles", None):
-            self.player.pos = resolve_circle_obstacles(self.player.pos, player_radius, s.obstacles)
-            self.player.pos = clamp_to_map(self.player.pos, config.ROOM_RADIUS * 0.9, s.map_type)
+        blocking = s.obstacles if config.ENABLE_OBSTACLES else None
+        clamp_player = map_clamper(s.map_type, config.ROOM_RADIUS * 0.9)
+        self.player.pos = resolve_and_clamp(self.player.pos, player_radius, blocking, clamp_player)
 
         if dt > 1e-6:
-            player_vel = (self.player.pos - old_pos) * (1.0 / dt)
+            inv_dt = 1.0 / dt
+            pos = self.player.pos
+            player_vel = Vec2((pos.x - old_x) * inv_dt, (pos.y - old_y) * inv_dt)
         else:
             player_vel = Vec2(0.0, 0.0)
 
@@ -721,7 +729,7 @@ class BrowserGame:
             aim = (world_mouse - self.player.pos).normalized()
             if aim.length() <= 1e-6:
                 aim = Vec2(1.0, 0.0)
-            muzzle = self.player.pos + aim * 14.0
+            muzzle = Vec2(self.player.pos.x + aim.x * 14.0, self.player.pos.y + aim.y * 14.0)
 
             if s.time < self.player.laser_until:
                 beam_len = config.ROOM_RADIUS * 1.6
@@ -729,9 +737,20 @@ class BrowserGame:
                 dmg = int(self._effective_player_damage() * 0.9) + 14
                 beam = LaserBeam(start=muzzle, end=end, damage=dmg, thickness=12.0, ttl=0.08, owner="player")
                 s.lasers.append(beam)
+                mx, my, ex, ey = muzzle.x, muzzle.y, end.x, end.y
+                half_w = beam.thickness * 0.5
+                # Reject enemies outside the beam's padded bounding box with
+                # plain compares before the segment-distance test.
+                pad = half_w + self.balance.max_enemy_radius
+                lo_x, hi_x = min(mx, ex) - pad, max(mx, ex) + pad
+                lo_y, hi_y = min(my, ey) - pad, max(my, ey) + pad
                 for enemy_obj in list(s.enemies):
-                    hit_r = beam.thickness * 0.5 + self._enemy_radius(enemy_obj)
-                    if point_segment_distance_sq(enemy_obj.pos, muzzle, end) <= hit_r * hit_r:
+                    x = enemy_obj.pos.x
+                    y = enemy_obj.pos.y
+                    if x < lo_x or x > hi_x or y < lo_y or y > hi_y:
+                        continue
+                    hit_r = half_w + self._enemy_radius(enemy_obj)
+                    if segment_point_dist2(x, y, mx, my, ex, ey) <= hit_r * hit_r:
                         enemy_obj.hp -= dmg
                         if enemy_obj.hp <= 0:
                             self._kill_enemy(enemy_obj)
@@ -753,15 +772,11 @@ class BrowserGame:
             self.player.last_shot = s.time
             self.player.next_shot_time = s.time + weapon_cd
 
+        clamp_enemy = map_clamper(s.map_type, config.ROOM_RADIUS * 0.96)
         for enemy_obj in list(s.enemies):
             update_enemy(enemy_obj, self.player.pos, s, dt, self, player_vel=player_vel)
-            behavior = enemy_behavior_name(enemy_obj)
-            enemy_obj._behavior_name = behavior
-            enemy_obj._radius = self.balance.enemy_radius(behavior)
-            enemy_obj.pos = clamp_to_map(enemy_obj.pos, config.ROOM_RADIUS * 0.96, s.map_type)
-            if config.ENABLE_OBSTACLES and getattr(s, "obstacles", None):
-                enemy_obj.pos = resolve_circle_obstacles(enemy_obj.pos, enemy_obj._radius, s.obstacles)
-                enemy_obj.pos = clamp_to_map(enemy_obj.pos, config.ROOM_RADIUS * 0.96, s.map_type)
+            enemy_obj._radius = self.balance.enemy_radius(enemy_obj._behavior_name)
+            enemy_obj.pos = resolve_and_clamp(enemy_obj.pos, enemy_obj._radius, blocking, clamp_enemy)
             hit_r = float(enemy_obj._radius) + float(player_radius)
             if dist_sq(enemy_obj.pos, self.player.pos) <= hit_r * hit_r:
                 self._damage_player(self.balance.enemy_contact_damage)
@@ -794,9 +809,10 @@ class BrowserGame:
                         enemy_obj.hp -= projectile.damage
                         self._remove_projectile(projectile)
                         if enemy_obj.hp <= 0:
-                            behavior = getattr(enemy_obj, "_behavior_name", enemy_behavior_name(enemy_obj))
+                            behavior = enemy_obj._behavior_name
                             self._kill_enemy(enemy_obj)
-                            if behavior == "tank" and dist(enemy_obj.pos, self.player.pos) < self.balance.tank_death_blast_radius:
+                            tank_r = self.balance.tank_death_blast_radius
+                            if behavior == "tank" and dist_sq(enemy_obj.pos, self.player.pos) < tank_r * tank_r:
                                 self._damage_player(self.balance.tank_death_blast_damage)
                         break
             else:
@@ -810,21 +826,34 @@ class BrowserGame:
                     self._damage_player(projectile.damage)
                     self._remove_projectile(projectile)
 
-        for powerup in list(s.powerups):
-            dpu2 = dist_sq(powerup.pos, self.player.pos)
-            magnet_r = self.balance.pickup_magnet_radius(getattr(powerup, "kind", ""), self._pickup_magnet_bonus)
-            if 1e-12 < dpu2 < float(magnet_r) * float(magnet_r):
-                distance_to_player = math.sqrt(dpu2)
-                pull = (self.player.pos - powerup.pos).normalized()
-                pull_speed = self.balance.pickup_pull_speed(magnet_r, distance_to_player)
-                powerup.pos = powerup.pos + pull * pull_speed * dt
-                dpu2 = dist_sq(powerup.pos, self.player.pos)
-            pickup_r = self.balance.pickup_radius(getattr(powerup, "kind", ""))
-            if dpu2 < float(pickup_r) * float(pickup_r):
-                apply_powerup(self.player, powerup, s.time)
-                self.particles.add_powerup_collection(powerup.pos, POWERUP_COLORS.get(getattr(powerup, 'kind', ''), (220, 220, 220)))
-                s.powerups.remove(powerup)
-                self.flash = max(self.flash, 0.18)
+        if s.powerups:
+            # Magnet and pickup reach depend only on the kind; resolve each
+            # kind once per frame as (magnet_r, magnet_r2, pickup_r2).
+            reach_by_kind: dict[str, tuple[float, float, float]] = {}
+            px, py = self.player.pos.x, self.player.pos.y
+            for powerup in list(s.powerups):
+                kind = getattr(powerup, "kind", "")
+                reach = reach_by_kind.get(kind)
+                if reach is None:
+                    magnet_r = float(self.balance.pickup_magnet_radius(kind, self._pickup_magnet_bonus))
+                    pickup_r = float(self.balance.pickup_radius(kind))
+                    reach = reach_by_kind[kind] = (magnet_r, magnet_r * magnet_r, pickup_r * pickup_r)
+                magnet_r, magnet_r2, pickup_r2 = reach
+                dx = px - powerup.pos.x
+                dy = py - powerup.pos.y
+                dpu2 = dx * dx + dy * dy
+                if 1e-12 < dpu2 < magnet_r2:
+                    distance_to_player = math.sqrt(dpu2)
+                    step = self.balance.pickup_pull_speed(magnet_r, distance_to_player) * dt / distance_to_player
+                    powerup.pos = Vec2(powerup.pos.x + dx * step, powerup.pos.y + dy * step)
+                    dx = px - powerup.pos.x
+                    dy = py - powerup.pos.y
+                    dpu2 = dx * dx + dy * dy
+                if dpu2 < pickup_r2:
+                    apply_powerup(self.player, powerup, s.time)
+                    self.particles.add_powerup_collection(powerup.pos, POWERUP_COLORS.get(getattr(powerup, 'kind', ''), (220, 220, 220)))
+                    s.powerups.remove(powerup)
+                    self.flash = max(self.flash, 0.18)
 
         if s.wave_active and not s.enemies:
             cleared_wave = int(s.wave)
@@ -849,7 +878,8 @@ class BrowserGame:
             beam.t += dt
             if beam.owner == "enemy" and beam.t >= beam.warn and not beam.hit_done:
                 hit_r = beam.thickness * 0.55 + player_radius * 0.35
-                if point_segment_distance_sq(self.player.pos, beam.start, beam.end) <= hit_r * hit_r:
+                ppos, a, b = self.player.pos, beam.start, beam.end
+                if segment_point_dist2(ppos.x, ppos.y, a.x, a.y, b.x, b.y) <= hit_r * hit_r:
                     beam.hit_done = True
                     self._damage_player(beam.damage)
                     s.shake = max(s.shake, 10.0)
@@ -872,8 +902,7 @@ class BrowserGame:
         if self.state:
             n_enemies = len(self.state.enemies)
             if n_enemies:
-                has_boss = any(str(getattr(enemy_obj, "behavior", "")).startswith("boss_") for enemy_obj in self.state.enemies)
-                combat_intensity = 0.8 if has_boss else min(0.55, 0.08 * n_enemies)
+                combat_intensity = 0.8 if self.state.boss_count > 0 else min(0.55, 0.08 * n_enemies)
 
         self._draw_background(combat_intensity)
         shake = Vec2(0.0, 0.0)
@@ -1443,8 +1472,8 @@ class BrowserGame:
 
     def _draw_enemy(self, enemy_obj, shake: Vec2) -> None:
         sx, sy = to_iso(enemy_obj.pos, shake)
-        name = getattr(enemy_obj, "_behavior_name", enemy_behavior_name(enemy_obj))
-        color = ENEMY_COLORS.get(name, (220, 220, 220))
+        name = enemy_obj._behavior_name
+        color = enemy_obj._color
         radius = getattr(enemy_obj, "_radius", self._enemy_radius(enemy_obj))
         boss = name.startswith("boss_")
         rx = max(10.0, radius * 0.95)
@@ -2068,9 +2097,11 @@ class BrowserGame:
         ctx.font = "600 15px Rajdhani, sans-serif"
         self._wrap_text(status, 24, self.view_h - 62, self.view_w - 48, 18)
 
-        boss = next((enemy_obj for enemy_obj in self.state.enemies if enemy_behavior_name(enemy_obj).startswith("boss_")), None)
+        boss = None
+        if self.state.boss_count > 0:
+            boss = next((enemy_obj for enemy_obj in self.state.enemies if enemy_obj._behavior_name.startswith("boss_")), None)
         if boss:
-            boss_name = enemy_behavior_name(boss)[5:].replace("_", " ").title()
+            boss_name = boss._behavior_name[5:].replace("_", " ").title()
             max_hp = max(1, int(boss.ai.get("max_hp", boss.hp)))
             ratio = max(0.0, min(1.0, boss.hp / max_hp))
             width = min(self.view_w * 0.44, 520)
@@ -2306,7 +2337,7 @@ class BrowserGame:
         ctx.stroke()
 
         for button in self.reward_buttons:
-            self._draw_button(button, card_text=button.payload.get("desc", ""))
+            self._draw_button(button, card_text=button.payload.desc)
 
     def _draw_game_over(self) -> None:
         scale = max(0.85, min(1.4, min(self.view_w / 1280.0, self.view_h / 820.0)))
@@ -2515,19 +2546,29 @@ class BrowserGame:
 
     def _wrap_text(self, text: str, x: float, y: float, max_width: float, line_height: float) -> None:
         ctx = self.ctx
-        words = text.split()
-        line = ""
+        # Reward cards and overlays redraw the same text every frame; only
+        # measure it (one JS call per word) the first time it is seen.
+        key = (text, max_width, ctx.font)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = []
+            line = ""
+            for word in text.split():
+                test = word if not line else f"{line} {word}"
+                if ctx.measureText(test).width > max_width and line:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = test
+            if line:
+                lines.append(line)
+            if len(self._wrap_cache) >= 64:
+                self._wrap_cache.clear()
+            self._wrap_cache[key] = lines
         cursor_y = y
-        for word in words:
-            test = word if not line else f"{line} {word}"
-            if ctx.measureText(test).width > max_width and line:
-                ctx.fillText(line, x, cursor_y)
-                line = word
-                cursor_y += line_height
-            else:
-                line = test
-        if line:
+        for line in lines:
             ctx.fillText(line, x, cursor_y)
+            cursor_y += line_height
 
     def _dispatch_click(self, x: float, y: float, button: int) -> None:
         if self.state_name == STATE_PLAYING:
@@ -2554,12 +2595,12 @@ class BrowserGame:
                 if btn.contains(x, y):
                     option = btn.payload
                     if self.reward_step == "temp":
-                        self._apply_temp_reward(option["key"], int(option.get("duration", 2)))
+                        self._apply_temp_reward(option.key, option.duration)
                         self.reward_step = "perm"
                         self.reward_message = "Pick one permanent boost"
                         self._rebuild_reward_buttons()
                     else:
-                        self._apply_perm_reward(option["key"])
+                        self._apply_perm_reward(option.key)
                         if self.state:
                             self.state.last_wave_clear = self.state.time - float(self.balance.wave_cooldown)
                         self.state_name = STATE_PLAYING
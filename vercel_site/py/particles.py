@@ -7,7 +7,7 @@ import math
 import config
 from utils import Vec2
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
     pos: Vec2
     vel: Vec2
@@ -158,7 +158,7 @@ import math
 import config
 from utils import Vec2
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
     pos: Vec2
     vel: Vec2
@@ -1,7 +1,8 @@
 """Physics and collision detection logic."""
 
 from dataclasses import dataclass
-from typing import Protocol,runtime_checkable
+import math
+from typing import Callable, Protocol, runtime_checkable
 
 from utils import Vec2
 
@@ -15,26 +16,43 @@ def resolve_circle_obstacles(pos: Vec2, radius: float, obstacles: list[PhysicalE
 
     `obstacles` is expected to have `pos` and `radius` attributes.
     """
-    p = Vec2(pos.x, pos.y)
+    # Works on plain floats and rejects non-overlapping obstacles on squared
+    # distance, so the common no-contact case costs no sqrt and no Vec2.
+    px = pos.x
+    py = pos.y
     for _ in range(max(1, iterations)):
         moved = False
         for o in obstacles:
             op = o.pos
             r = radius + float(o.radius)
-            d = p - op
-            l = d.length()
-            if l >= r:
+            dx = px - op.x
+            dy = py - op.y
+            l2 = dx * dx + dy * dy
+            if l2 >= r * r:
                 continue
+            l = math.sqrt(l2)
             if l <= 1e-6:
                 # Nudge in a stable direction.
-                d = Vec2(1.0, 0.0)
+                dx = 1.0
+                dy = 0.0
                 l = 1.0
             push = (r - l) / l
-            p = Vec2(p.x + d.x * push, p.y + d.y * push)
+            px += dx * push
+            py += dy * push
             moved = True
         if not moved:
             break
-    return p
+    return Vec2(px, py)
+
+def resolve_and_clamp(pos: Vec2, radius: float, obstacles, clamp: Callable[[Vec2], Vec2]) -> Vec2:
+    """Push a circle out of `obstacles`, then keep it inside the map with `clamp`.
+
+    Single entry point for per-frame movement settling; with no obstacles this
+    is just the clamp.
+    """
+    if obstacles:
+        pos = resolve_circle_obstacles(pos, radius, obstacles)
+    return clamp(pos)
 
 def check_circle_collision(pos1: Vec2, r1: float, pos2: Vec2, r2: float) -> bool:
     """Check if two circles overlap."""
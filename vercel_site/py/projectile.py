@@ -1,6 +1,7 @@
 """Projectile entity and related functionality."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import math
 import random
 from typing import TYPE_CHECKING
@@ -10,7 +11,7 @@ from utils import Vec2
 if TYPE_CHECKING:
     from weapons import Weapon
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """Projectile entity."""
     pos: Vec2
@@ -24,11 +25,13 @@ class Projectile:
 
     def update(self, dt: float) -> bool:
         """Update projectile position and TTL. Returns False if expired."""
-        self.prev_pos = self.pos
-        self.history.append(Vec2(self.pos.x, self.pos.y))
+        pos = self.pos
+        vel = self.vel
+        self.prev_pos = pos
+        self.history.append(Vec2(pos.x, pos.y))
         if len(self.history) > 6:
             self.history.pop(0)
-        self.pos = self.pos + self.vel * dt
+        self.pos = Vec2(pos.x + vel.x * dt, pos.y + vel.y * dt)
         self.ttl -= dt
         return self.ttl > 0
 
@@ -38,6 +41,19 @@ def _rotate_dir(aim: Vec2, angle_deg: float) -> Vec2:
     c, s = math.cos(rad), math.sin(rad)
     return Vec2(aim.x * c - aim.y * s, aim.x * s + aim.y * c)
 
+# Pellet lifetime for weapons that fire a fan of `projectile_count` shots.
+_FAN_TTL: dict[str, float] = {"bullet": 2.0, "spread": 2.2, "plasma": 2.5}
+
+@lru_cache(maxsize=64)
+def _spread_cossin(count: int, spread: float) -> tuple[tuple[float, float, float], ...]:
+    """Per-pellet ``(offset_deg, cos, sin)`` for a fan of `count` shots `spread` degrees apart."""
+    table = []
+    for i in range(count):
+        offset = (i - count / 2 + 0.5) * spread
+        rad = math.radians(offset)
+        table.append((offset, math.cos(rad), math.sin(rad)))
+    return tuple(table)
+
 def spawn_projectiles(
     muzzle: Vec2,
     aim_direction: Vec2,
@@ -48,59 +64,44 @@ def spawn_projectiles(
     rng: random.Random | None = None,
 ) -> list[Projectile]:
     """Spawn projectiles based on weapon type."""
-    projectiles = []
     rng = rng or random
     
     # Weapon damage = weapon base damage + player damage bonus (50%)
     final_damage = weapon.damage + int(base_damage * 0.5)
 
     recoil = float(recoil_deg) if recoil_deg and recoil_deg > 0 else 0.0
+    ptype = weapon.projectile_type
     
-    if weapon.projectile_type == "bullet":
-        for i in range(weapon.projectile_count):
-            angle_offset = (i - weapon.projectile_count / 2 + 0.5) * weapon.spread_angle
-            jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
-            d = _rotate_dir(aim_direction, angle_offset + jitter)
-            vel = d * weapon.projectile_speed
-            projectiles.append(Projectile(
-                muzzle, vel, final_damage,
-                ttl=2.0, owner="player", projectile_type="bullet"
-            ))
-    
-    elif weapon.projectile_type == "spread":
-        for i in range(weapon.projectile_count):
-            angle_offset = (i - weapon.projectile_count / 2 + 0.5) * weapon.spread_angle
-            jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
-            d = _rotate_dir(aim_direction, angle_offset + jitter)
-            vel = d * weapon.projectile_speed
+    if ptype in _FAN_TTL:
+        # Fan offsets are fixed per weapon, so their rotations come from a cached
+        # table; only recoil jitter needs fresh trig per pellet.
+        ttl = _FAN_TTL[ptype]
+        speed = weapon.projectile_speed
+        ax, ay = aim_direction.x, aim_direction.y
+        projectiles = []
+        for offset, c, s in _spread_cossin(weapon.projectile_count, weapon.spread_angle):
+            if recoil:
+                rad = math.radians(offset + rng.uniform(-recoil, recoil))
+                c, s = math.cos(rad), math.sin(rad)
             projectiles.append(Projectile(
-                muzzle, vel, final_damage,
-                ttl=2.2, owner="player", projectile_type="spread"
+                muzzle, Vec2((ax * c - ay * s) * speed, (ax * s + ay * c) * speed),
+                final_damage, ttl=ttl, owner="player", projectile_type=ptype,
             ))
+        return projectiles
     
-    elif weapon.projectile_type == "missile":
+    elif ptype == "missile":
         jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
         d = _rotate_dir(aim_direction, jitter) if jitter else aim_direction
         vel = d * weapon.projectile_speed
         muzzle_extended = muzzle + aim_direction * 4.0
-        projectiles.append(Projectile(muzzle_extended, vel, final_damage, ttl=3.0, owner="player", projectile_type="missile"))
-    
-    elif weapon.projectile_type == "plasma":
-        for i in range(weapon.projectile_count):
-            angle_offset = (i - weapon.projectile_count / 2 + 0.5) * weapon.spread_angle
-            jitter = rng.uniform(-recoil, recoil) if recoil else 0.0
-            d = _rotate_dir(aim_direction, angle_offset + jitter)
-            vel = d * weapon.projectile_speed
-            projectiles.append(Projectile(muzzle, vel, final_damage, ttl=2.5, owner="player", projectile_type="plasma"))
+        return [Projectile(muzzle_extended, vel, final_damage, ttl=3.0, owner="player", projectile_type="missile")]
     
-    elif weapon.projectile_type == "laser":
+    elif ptype == "laser":
         # Fast moving visual beam
         vel = aim_direction * 2000.0
-        projectiles.append(Projectile(
+        return [Projectile(
             muzzle, vel, final_damage,
             ttl=0.05, owner="player", projectile_type="laser"
-        ))
-    
-        return projectiles
+        )]
 
-    return projectiles
+    return []
@@ -3,31 +3,47 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from player import Player
 
 
-TEMP_REWARD_POOL: list[dict] = [
-    {"key": "temp_overdrive", "title": "Overdrive", "desc": "+28% damage for 2 waves", "duration": 2},
-    {"key": "temp_haste", "title": "Haste Drive", "desc": "+22% move speed for 3 waves", "duration": 3},
-    {"key": "temp_rapidfire", "title": "Hot Trigger", "desc": "22% faster fire-rate for 2 waves", "duration": 2},
-    {"key": "temp_magnet", "title": "Magnet Core", "desc": "Wider pickup magnet for 3 waves", "duration": 3},
-    {"key": "temp_guard", "title": "Aegis Skin", "desc": "-18% incoming damage for 2 waves", "duration": 2},
-    {"key": "temp_ultra_flux", "title": "Ultra Flux", "desc": "Ultra cooldown reduced for 3 waves", "duration": 3},
-]
-
-PERM_REWARD_POOL: list[dict] = [
-    {"key": "perm_damage", "title": "Core Damage", "desc": "+1 damage this run"},
-    {"key": "perm_speed", "title": "Servo Boost", "desc": "+6 move speed this run"},
-    {"key": "perm_hp", "title": "Hull Plating", "desc": "+6 max HP this run"},
-    {"key": "perm_fire", "title": "Trigger Tuning", "desc": "Slightly faster shots this run"},
-    {"key": "perm_shield", "title": "Shield Layer", "desc": "+18 shield now"},
-    {"key": "perm_ultra", "title": "Ultra Charge", "desc": "+1 Ultra charge now"},
-    {"key": "perm_dash", "title": "Quick Dash", "desc": "Dash cooldown reduced this run"},
-    {"key": "perm_double_dash", "title": "Double Dash", "desc": "+1 dash charge this run"},
-]
+@dataclass(frozen=True, slots=True)
+class RewardOption:
+    """One boss reward card."""
+    key: str
+    title: str
+    desc: str
+    duration: int = 0  # waves; temp rewards only
+
+
+TEMP_REWARD_POOL: tuple[RewardOption, ...] = (
+    RewardOption("temp_overdrive", "Overdrive", "+28% damage for 2 waves", 2),
+    RewardOption("temp_haste", "Haste Drive", "+22% move speed for 3 waves", 3),
+    RewardOption("temp_rapidfire", "Hot Trigger", "22% faster fire-rate for 2 waves", 2),
+    RewardOption("temp_magnet", "Magnet Core", "Wider pickup magnet for 3 waves", 3),
+    RewardOption("temp_guard", "Aegis Skin", "-18% incoming damage for 2 waves", 2),
+    RewardOption("temp_ultra_flux", "Ultra Flux", "Ultra cooldown reduced for 3 waves", 3),
+)
+
+PERM_REWARD_POOL: tuple[RewardOption, ...] = (
+    RewardOption("perm_damage", "Core Damage", "+1 damage this run"),
+    RewardOption("perm_speed", "Servo Boost", "+6 move speed this run"),
+    RewardOption("perm_hp", "Hull Plating", "+6 max HP this run"),
+    RewardOption("perm_fire", "Trigger Tuning", "Slightly faster shots this run"),
+    RewardOption("perm_shield", "Shield Layer", "+18 shield now"),
+    RewardOption("perm_ultra", "Ultra Charge", "+1 Ultra charge now"),
+    RewardOption("perm_dash", "Quick Dash", "Dash cooldown reduced this run"),
+    RewardOption("perm_double_dash", "Double Dash", "+1 dash charge this run"),
+)
+
+# Pool order and key -> option lookups, so rolls filter plain key strings.
+_TEMP_REWARD_KEYS: tuple[str, ...] = tuple(x.key for x in TEMP_REWARD_POOL)
+_TEMP_REWARD_BY_KEY: dict[str, RewardOption] = {x.key: x for x in TEMP_REWARD_POOL}
+_PERM_REWARD_KEYS: tuple[str, ...] = tuple(x.key for x in PERM_REWARD_POOL)
+_PERM_REWARD_BY_KEY: dict[str, RewardOption] = {x.key: x for x in PERM_REWARD_POOL}
 
 TEMP_REWARD_NAMES: dict[str, str] = {
     "temp_overdrive": "Overdrive",
@@ -50,61 +66,124 @@ PERM_REWARD_NAMES: dict[str, str] = {
 }
 
 
+# Temp reward key -> (modifier, factor, bonus): modifier = modifier * factor + bonus.
+_TEMP_REWARD_MODS: dict[str, tuple[str, float, float]] = {
+    "temp_overdrive": ("damage", 1.28, 0.0),
+    "temp_haste": ("speed", 1.22, 0.0),
+    "temp_rapidfire": ("fire_rate", 0.78, 0.0),
+    "temp_magnet": ("magnet", 1.0, 80.0),
+    "temp_guard": ("incoming_damage", 0.82, 0.0),
+    "temp_ultra_flux": ("ultra_cd", 0.7, 0.0),
+}
+
+_NEUTRAL_TEMP_MODS: dict[str, float] = {
+    "damage": 1.0,
+    "speed": 1.0,
+    "fire_rate": 1.0,
+    "magnet": 0.0,
+    "incoming_damage": 1.0,
+    "ultra_cd": 1.0,
+}
+
+
 def recompute_temp_mods(active_temp_rewards: list[dict]) -> dict[str, float]:
     """Return computed modifier values from active temp rewards."""
-    dmg = 1.0
-    speed = 1.0
-    fire = 1.0
-    magnet = 0.0
-    incoming = 1.0
-    ultra_cd = 1.0
-    for fx in list(active_temp_rewards):
-        k = str(fx.get("key", ""))
-        if k == "temp_overdrive":
-            dmg *= 1.28
-        elif k == "temp_haste":
-            speed *= 1.22
-        elif k == "temp_rapidfire":
-            fire *= 0.78
-        elif k == "temp_magnet":
-            magnet += 80.0
-        elif k == "temp_guard":
-            incoming *= 0.82
-        elif k == "temp_ultra_flux":
-            ultra_cd *= 0.7
-    return {
-        "damage": dmg,
-        "speed": speed,
-        "fire_rate": fire,
-        "magnet": magnet,
-        "incoming_damage": incoming,
-        "ultra_cd": ultra_cd,
-    }
+    mods = _NEUTRAL_TEMP_MODS.copy()
+    if not active_temp_rewards:
+        return mods
+    for fx in active_temp_rewards:
+        mod = _TEMP_REWARD_MODS.get(fx["key"])
+        if mod is not None:
+            name, factor, bonus = mod
+            mods[name] = mods[name] * factor + bonus
+    return mods
 
 
 def advance_temp_rewards(active_list: list[dict]) -> list[dict]:
-    """Decrement wave counters and return kept rewards."""
-    kept: list[dict] = []
+    """Decrement wave counters and return kept rewards.
+
+    Expired entries are compacted out of `active_list` in place, and the same
+    list is returned."""
+    n = 0
     for fx in active_list:
-        left = int(fx.get("waves_left", 0)) - 1
+        left = fx["waves_left"] - 1
         if left > 0:
             fx["waves_left"] = left
-            kept.append(fx)
-    return kept
+            active_list[n] = fx
+            n += 1
+    del active_list[n:]
+    return active_list
 
 
 def apply_temp_reward(active_list: list[dict], key: str, duration: int) -> list[dict]:
-    """Add or refresh a temp reward in the active list."""
-    k = str(key or "").strip().lower()
+    """Add or refresh a temp reward in the active list.
+
+    `key` must already be normalized (lowercase, stripped) like the pool keys;
+    the game's pick handlers normalize it once before calling in."""
     dur = max(2, min(3, int(duration)))
     for fx in active_list:
-        if str(fx.get("key", "")) == k:
-            fx["waves_left"] = max(int(fx.get("waves_left", 0)), dur)
+        if fx["key"] == key:
+            fx["waves_left"] = max(fx["waves_left"], dur)
             return active_list
-    active_list.append({"key": k, "waves_left": dur})
+    # The only place entries are created; readers index both fields directly.
+    active_list.append({"key": key, "waves_left": dur})
     return active_list
 
 
+def _perm_damage(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.damage = int(player.damage) + 1
+    return dash_cd_mult
+
+
+def _perm_speed(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.speed = float(player.speed) + 6.0
+    return dash_cd_mult
+
+
+def _perm_hp(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.max_hp += 6
+    player.hp = min(int(player.max_hp), int(player.hp) + 6)
+    return dash_cd_mult
+
+
+def _perm_fire(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.fire_rate = max(0.12, float(player.fire_rate) - 0.006)
+    return dash_cd_mult
+
+
+def _perm_shield(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.shield = min(120, int(player.shield) + 18)
+    return dash_cd_mult
+
+
+def _perm_ultra(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.ultra_charges = min(ultra_max_charges, int(player.ultra_charges) + 1)
+    return dash_cd_mult
+
+
+def _perm_dash(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    return max(0.6, float(dash_cd_mult) * 0.90)
+
+
+def _perm_double_dash(player: "Player", dash_cd_mult: float, ultra_max_charges: int) -> float:
+    player.dash_max_charges = min(2, player.dash_max_charges + 1)
+    player.dash_charges = int(player.dash_max_charges)
+    return dash_cd_mult
+
+
+# Permanent reward handlers keyed by reward key; each returns the updated dash_cd_mult.
+_PERM_REWARD_HANDLERS: dict[str, Callable[["Player", float, int], float]] = {
+    "perm_damage": _perm_damage,
+    "perm_speed": _perm_speed,
+    "perm_hp": _perm_hp,
+    "perm_fire": _perm_fire,
+    "perm_shield": _perm_shield,
+    "perm_ultra": _perm_ultra,
+    "perm_dash": _perm_dash,
+    "perm_double_dash": _perm_double_dash,
+}
+
+
 def apply_perm_reward(
     player: "Player",
     run_perms: list[str],
@@ -112,56 +191,39 @@ def apply_perm_reward(
     dash_cd_mult: float,
     ultra_max_charges: int = 2,
 ) -> tuple[float, bool]:
-    """Apply a permanent reward to the player."""
-    k = str(key or "").strip().lower()
-    applied = True
-    if k == "perm_damage":
-        player.damage = int(player.damage) + 1
-    elif k == "perm_speed":
-        player.speed = float(player.speed) + 6.0
-    elif k == "perm_hp":
-        player.max_hp = int(getattr(player, "max_hp", player.hp)) + 6
-        player.hp = min(int(player.max_hp), int(player.hp) + 6)
-    elif k == "perm_fire":
-        player.fire_rate = max(0.12, float(player.fire_rate) - 0.006)
-    elif k == "perm_shield":
-        player.shield = min(120, int(getattr(player, "shield", 0)) + 18)
-    elif k == "perm_ultra":
-        player.ultra_charges = min(ultra_max_charges, int(player.ultra_charges) + 1)
-    elif k == "perm_dash":
-        dash_cd_mult = max(0.6, float(dash_cd_mult) * 0.90)
-    elif k == "perm_double_dash":
-        player.dash_max_charges = min(2, int(getattr(player, "dash_max_charges", 1)) + 1)
-        player.dash_charges = int(player.dash_max_charges)
-    else:
-        applied = False
-
-    if applied and k not in run_perms:
-        run_perms.append(k)
-
-    return dash_cd_mult, applied
+    """Apply a permanent reward to the player.
+
+    `key` is expected pre-normalized, as for `apply_temp_reward`."""
+    handler = _PERM_REWARD_HANDLERS.get(key)
+    if handler is None:
+        return dash_cd_mult, False
+
+    dash_cd_mult = handler(player, dash_cd_mult, ultra_max_charges)
+    if key not in run_perms:
+        run_perms.append(key)
+
+    return dash_cd_mult, True
 
 
 def roll_boss_rewards(
     active_temp_rewards: list[dict],
     last_temp_key: str,
     last_perm_key: str,
-) -> tuple[list[dict], list[dict]]:
+) -> tuple[list[RewardOption], list[RewardOption]]:
     """Pick 3 temp and 3 perm reward candidates."""
-    active_temp = {str(x.get("key", "")) for x in active_temp_rewards}
-    temp_candidates = [
-        x for x in TEMP_REWARD_POOL
-        if x["key"] not in active_temp and x["key"] != last_temp_key
-    ]
-    if len(temp_candidates) < 3:
-        temp_candidates = [x for x in TEMP_REWARD_POOL if x["key"] not in active_temp] or list(TEMP_REWARD_POOL)
-
-    perm_candidates = [x for x in PERM_REWARD_POOL if x["key"] != last_perm_key]
-    if len(perm_candidates) < 3:
-        perm_candidates = list(PERM_REWARD_POOL)
-
-    temp_opts = random.sample(temp_candidates, k=min(3, len(temp_candidates)))
-    perm_opts = random.sample(perm_candidates, k=min(3, len(perm_candidates)))
+    # At most a couple of rewards are active, so a list scan beats building a set.
+    active_temp = [x["key"] for x in active_temp_rewards]
+    inactive = [k for k in _TEMP_REWARD_KEYS if k not in active_temp]
+    temp_keys = [k for k in inactive if k != last_temp_key]
+    if len(temp_keys) < 3:
+        temp_keys = inactive or _TEMP_REWARD_KEYS
+
+    perm_keys = [k for k in _PERM_REWARD_KEYS if k != last_perm_key]
+    if len(perm_keys) < 3:
+        perm_keys = _PERM_REWARD_KEYS
+
+    temp_opts = [_TEMP_REWARD_BY_KEY[k] for k in random.sample(temp_keys, k=min(3, len(temp_keys)))]
+    perm_opts = [_PERM_REWARD_BY_KEY[k] for k in random.sample(perm_keys, k=min(3, len(perm_keys)))]
     return temp_opts, perm_opts
 
 
@@ -171,10 +233,10 @@ def format_temp_hud(active_list: list[dict]) -> str:
         return ""
     parts: list[str] = []
     for fx in active_list[:2]:
-        key = str(fx.get("key", ""))
-        left = int(fx.get("waves_left", 0))
-        if key in TEMP_REWARD_NAMES and left > 0:
-            parts.append(f"{TEMP_REWARD_NAMES[key]}:{left}")
+        name = TEMP_REWARD_NAMES.get(fx["key"])
+        left = fx["waves_left"]
+        if name and left > 0:
+            parts.append(f"{name}:{left}")
     if not parts:
         return ""
     return "Temp " + ", ".join(parts)
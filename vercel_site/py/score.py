@@ -1,5 +1,6 @@
 """Score tracking, combo system, and high-score persistence."""
 
+import heapq
 import json
 import os
 import time as _time
@@ -9,6 +10,11 @@ try:
 except Exception:  # pragma: no cover - desktop fallback
     window = None
 
+try:
+    import orjson  # optional: faster high-score (de)serialization
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Point values per enemy type (base, before combo multiplier)
 # ---------------------------------------------------------------------------
@@ -47,9 +53,23 @@ MAX_HIGH_SCORES = 5
 LOCAL_STORAGE_KEY = "plouto-high-scores"
 
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> str:
+        return orjson.dumps(data).decode("utf-8")
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> str:
+        return json.dumps(data, separators=(",", ":"))
+
+
 class ScoreTracker:
     """Tracks score, combo multiplier, and high scores for a single run."""
 
+    __slots__ = ("score", "combo", "_combo_timer", "difficulty", "kills", "best_combo")
+
     def __init__(self, difficulty: str = "normal"):
         self.score: int = 0
         self.combo: float = 1.0
@@ -62,16 +82,24 @@ class ScoreTracker:
     # Events
     # ------------------------------------------------------------------
 
-    def on_enemy_kill(self, behavior: str) -> int:
+    # on_enemy_kill and update bind module constants as keyword-only defaults
+    # so their hot paths read fast locals instead of globals.
+    def on_enemy_kill(
+        self, behavior: str, *, _points=KILL_POINTS, _cmax=COMBO_MAX, _cinc=COMBO_INCREMENT
+    ) -> int:
         """Record an enemy kill.  Returns points awarded."""
-        base = KILL_POINTS.get(behavior, 100)
+        base = _points.get(behavior, 100)
         points = int(base * self.combo)
         self.score += points
         self.kills += 1
 
         # Build combo
-        self.combo = min(COMBO_MAX, self.combo + COMBO_INCREMENT)
-        self.best_combo = max(self.best_combo, self.combo)
+        combo = self.combo + _cinc
+        if combo > _cmax:
+            combo = _cmax
+        self.combo = combo
+        if combo > self.best_combo:
+            self.best_combo = combo
         self._combo_timer = 0.0
         return points
 
@@ -94,10 +122,14 @@ class ScoreTracker:
     # Per-frame update (combo decay)
     # ------------------------------------------------------------------
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, *, _delay=COMBO_DECAY_DELAY, _rate=COMBO_DECAY_RATE) -> None:
+        # At the floor there is nothing to decay; every kill resets the timer
+        # anyway, so it does not need to keep running while idle.
+        if self.combo <= 1.0:
+            return
         self._combo_timer += dt
-        if self._combo_timer >= COMBO_DECAY_DELAY and self.combo > 1.0:
-            self.combo = max(1.0, self.combo - COMBO_DECAY_RATE * dt)
+        if self._combo_timer >= _delay:
+            self.combo = max(1.0, self.combo - _rate * dt)
 
     # ------------------------------------------------------------------
     # High-score persistence
@@ -110,14 +142,14 @@ class ScoreTracker:
             try:
                 raw = window.localStorage.getItem(LOCAL_STORAGE_KEY)
                 if raw:
-                    data = json.loads(raw)
+                    data = _json_loads(raw)
                     if isinstance(data, dict):
                         return data
             except Exception:
                 pass
         try:
             with open(HIGH_SCORE_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                data = _json_loads(f.read())
             if isinstance(data, dict):
                 return data
         except (FileNotFoundError, json.JSONDecodeError, OSError):
@@ -129,13 +161,16 @@ class ScoreTracker:
         """Persist high scores to disk."""
         if window is not None:
             try:
-                window.localStorage.setItem(LOCAL_STORAGE_KEY, json.dumps(data))
+                window.localStorage.setItem(LOCAL_STORAGE_KEY, _json_dumps(data))
                 return
             except Exception:
                 pass
         try:
-            with open(HIGH_SCORE_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Write-then-rename so a crash mid-save never leaves a truncated file.
+            tmp = HIGH_SCORE_FILE + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(_json_dumps(data))
+            os.replace(tmp, HIGH_SCORE_FILE)
         except OSError:
             pass
 
@@ -152,8 +187,8 @@ class ScoreTracker:
             "date": _time.strftime("%Y-%m-%d %H:%M"),
         }
         entries.append(entry)
-        entries.sort(key=lambda e: e["score"], reverse=True)
-        entries = entries[:MAX_HIGH_SCORES]
+        # Same order as a stable descending sort, without sorting the whole list.
+        entries = heapq.nlargest(MAX_HIGH_SCORES, entries, key=lambda e: e["score"])
         data[self.difficulty] = entries
         self.save_high_scores(data)
 
@@ -3,6 +3,8 @@
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable
 
 from config import ISO_SCALE_X, ISO_SCALE_Y, SCREEN_H, SCREEN_W, MAP_CIRCLE, MAP_DONUT, MAP_CROSS, MAP_DIAMOND
 
@@ -50,7 +52,7 @@ def compute_room_radius(view_w: int, view_h: int, margin: float = 0.92) -> float
     return max(120.0, min(1200.0, float(r)))
 
 
-@dataclass
+@dataclass(slots=True)
 class Vec2:
     """2D Vector class."""
     x: float
@@ -99,6 +101,15 @@ def to_iso(world: Vec2, shake: Vec2) -> tuple[float, float]:
     return (ix + VIEW_W / 2 + shake.x, iy + VIEW_H / 2 + shake.y)
 
 
+def iso_origin(shake: Vec2) -> tuple[float, float]:
+    """Screen position of the world origin for this frame's shake offset.
+
+    ``to_iso(w, shake) == ((w.x - w.y) * ISO_SCALE_X + ox, (w.x + w.y) * ISO_SCALE_Y + oy)``
+    where ``ox, oy = iso_origin(shake)``; hot loops can resolve it once per frame.
+    """
+    return (VIEW_W / 2 + shake.x, VIEW_H / 2 + shake.y)
+
+
 def iso_to_world(screen_xy: tuple[float, float]) -> Vec2:
     """Convert isometric screen coordinates to world coordinates."""
     ix = screen_xy[0] - VIEW_W / 2
@@ -183,6 +194,29 @@ def clamp_to_map(p: Vec2, radius: float, map_type: str = "circle") -> Vec2:
     return p
 
 
+@lru_cache(maxsize=16)
+def map_clamper(map_type: str, radius: float) -> Callable[[Vec2], Vec2]:
+    """`clamp_to_map` bound to one map shape and radius.
+
+    Hot loops fetch this once per frame and call it per entity, skipping the
+    map-type dispatch; the circular map gets a squared-distance fast path.
+    """
+    if map_type != MAP_CIRCLE:
+        return partial(clamp_to_map, radius=radius, map_type=map_type)
+    r2 = radius * radius
+
+    def clamp_circle(p: Vec2) -> Vec2:
+        x = p.x
+        y = p.y
+        d2 = x * x + y * y
+        if d2 <= r2:
+            return p
+        scale = radius / math.sqrt(d2)
+        return Vec2(x * scale, y * scale)
+
+    return clamp_circle
+
+
 def random_spawn_map_edge(center: Vec2, radius: float, map_type: str = "circle", rng: random.Random | None = None) -> Vec2:
     """Spawn a position on the edge of the map.
 
@@ -226,7 +260,7 @@ def random_spawn_map_edge(center: Vec2, radius: float, map_type: str = "circle",
 
 def dist(a: Vec2, b: Vec2) -> float:
     """Calculate distance between two positions."""
-    return (a - b).length()
+    return math.hypot(a.x - b.x, a.y - b.y)
 
 
 def dist_sq(a: Vec2, b: Vec2) -> float:
@@ -251,19 +285,29 @@ def point_segment_distance(p: Vec2, a: Vec2, b: Vec2) -> float:
 
 def point_segment_distance_sq(p: Vec2, a: Vec2, b: Vec2) -> float:
     """Squared distance from point p to segment ab."""
-    ab = b - a
-    ap = p - a
-    ab_len2 = ab.x * ab.x + ab.y * ab.y
+    return segment_point_dist2(p.x, p.y, a.x, a.y, b.x, b.y)
+
+
+def segment_point_dist2(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """Squared distance from (px, py) to segment (ax, ay)-(bx, by).
+
+    Float-only form of `point_segment_distance_sq` for hit tests that compare
+    against a squared radius: no sqrt and no temporary vectors.
+    """
+    abx = bx - ax
+    aby = by - ay
+    apx = px - ax
+    apy = py - ay
+    ab_len2 = abx * abx + aby * aby
     if ab_len2 <= 1e-9:
-        return ap.x * ap.x + ap.y * ap.y
-    t = (ap.x * ab.x + ap.y * ab.y) / ab_len2
+        return apx * apx + apy * apy
+    t = (apx * abx + apy * aby) / ab_len2
     if t < 0.0:
         t = 0.0
     elif t > 1.0:
         t = 1.0
-    closest = Vec2(a.x + ab.x * t, a.y + ab.y * t)
-    dx = p.x - closest.x
-    dy = p.y - closest.y
+    dx = apx - abx * t
+    dy = apy - aby * t
     return dx * dx + dy * dy
 
 
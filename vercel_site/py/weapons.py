@@ -1,6 +1,7 @@
 """Weapon system with different projectile types."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from utils import Vec2
 from config import (
@@ -135,8 +136,15 @@ def get_effective_fire_rate(weapon: Weapon, player_fire_rate: float) -> float:
     Player fire_rate acts as a global modifier relative to PLAYER_FIRE_RATE,
     while each weapon has its own base fire_rate.
     """
-    base = max(FIRE_RATE_MIN, float(weapon.fire_rate))
-    ratio = float(player_fire_rate) / max(FIRE_RATE_MIN, float(PLAYER_FIRE_RATE))
+    return _fire_cooldown(float(weapon.fire_rate), float(player_fire_rate))
+
+
+@lru_cache(maxsize=64)
+def _fire_cooldown(weapon_fire_rate: float, player_fire_rate: float) -> float:
+    # Inputs only change on weapon swaps and fire-rate rewards, so the curve is
+    # evaluated once per combination instead of every frame.
+    base = max(FIRE_RATE_MIN, weapon_fire_rate)
+    ratio = player_fire_rate / max(FIRE_RATE_MIN, float(PLAYER_FIRE_RATE))
     ratio = max(FIRE_RATE_RATIO_MIN, min(FIRE_RATE_RATIO_MAX, ratio))
     ratio = pow(ratio, FIRE_RATE_CURVE)
     return max(FIRE_RATE_MIN, base * ratio)
@@ -9,8 +9,8 @@ import pyglet
 from pyglet import shapes
 from pyglet.graphics import Group
 
-from config import ENEMY_COLORS, SCREEN_H
-from utils import to_iso, Vec2, enemy_behavior_name
+from config import ENEMY_COLORS, ISO_SCALE_X, ISO_SCALE_Y, SCREEN_H
+from utils import iso_origin, to_iso, Vec2
 
 # Reduce group churn by bucketing depth values.
 DEPTH_BUCKET = 4
@@ -306,7 +306,7 @@ class Visuals:
         """Ensure enemy visual exists."""
         if id(enemy) in self._enemy_handles:
             return
-        behavior = enemy_behavior_name(enemy)
+        behavior = enemy._behavior_name
         base = ENEMY_COLORS.get(behavior, (200, 120, 120))
 
         sh = shapes.Ellipse(0, 0, 20, 7, color=(0, 0, 0), batch=self.batch)
@@ -522,7 +522,7 @@ class Visuals:
     def sync_enemy(self, enemy, shake: Vec2):
         """Update enemy visual position."""
         h = self._enemy_handles[id(enemy)]
-        behavior = enemy_behavior_name(enemy)
+        behavior = enemy._behavior_name
         sx, sy = to_iso(enemy.pos, shake)
         bob = math.sin(enemy.t * 6.0) * 1.5
 
@@ -779,6 +779,16 @@ class Visuals:
         eye2.x, eye2.y = sx + 2, sy + 1
         self._set_depth(h, sy)
 
+    def sync_enemies(self, enemies, shake: Vec2):
+        """Ensure and update visuals for every enemy in one call."""
+        handles = self._enemy_handles
+        ensure = self.ensure_enemy
+        sync = self.sync_enemy
+        for e in enemies:
+            if id(e) not in handles:
+                ensure(e)
+            sync(e, shake)
+
     def drop_enemy(self, enemy):
         """Remove enemy visual."""
         h = self._enemy_handles.pop(id(enemy), None)
@@ -846,32 +856,45 @@ class Visuals:
         flare.opacity = 120
         self._proj_handles[id(proj)] = RenderHandle(trail, sh, core, flare)
 
-    def sync_projectile(self, proj, shake: Vec2):
-        """Update projectile visual position."""
-        h = self._proj_handles[id(proj)]
-        if len(h.objs) == 3:
-            sh, core, flare = h.objs
-            trail = None
-        else:
-            trail, sh, core, flare = h.objs
-        sx, sy = to_iso(proj.pos, shake)
-        v = getattr(proj, "vel", Vec2(0.0, 0.0))
-        v2 = Vec2(v.x, v.y)
-        speed = v2.length()
-        if trail is not None:
-            if speed <= 1e-6:
-                v2 = Vec2(1.0, 0.0)
-                speed = 1.0
-            vd = v2.normalized()
-            trail_len = 8 + min(16.0, speed * 0.03)
-            trail.x, trail.y = sx, sy
-            trail.x2, trail.y2 = sx - vd.x * trail_len, sy - vd.y * trail_len * 0.65
-            trail.opacity = 95 if str(getattr(proj, "owner", "player")) == "enemy" else 125
-        sh.x, sh.y = sx, sy
-        core.x, core.y = sx, sy
-        flare.x, flare.y = sx, sy
-        flare.opacity = 90 if str(getattr(proj, "owner", "player")) == "enemy" else 130
-        self._set_depth(h, sy)
+    def sync_projectiles(self, projectiles, shake: Vec2):
+        """Ensure and update visuals for every projectile in one call.
+
+        The iso origin is resolved once and each shape is moved through a
+        single ``position`` write.
+        """
+        handles = self._proj_handles
+        ensure = self.ensure_projectile
+        set_depth = self._set_depth
+        ox, oy = iso_origin(shake)
+        for proj in projectiles:
+            h = handles.get(id(proj))
+            if h is None:
+                ensure(proj)
+                h = handles[id(proj)]
+            pos = proj.pos
+            sx = (pos.x - pos.y) * ISO_SCALE_X + ox
+            sy = (pos.x + pos.y) * ISO_SCALE_Y + oy
+            xy = (sx, sy)
+            is_enemy = str(getattr(proj, "owner", "player")) == "enemy"
+            objs = h.objs
+            if len(objs) == 3:
+                sh, core, flare = objs
+            else:
+                trail, sh, core, flare = objs
+                v = getattr(proj, "vel", None)
+                vx, vy = (v.x, v.y) if v is not None else (0.0, 0.0)
+                speed = math.hypot(vx, vy)
+                if speed <= 1e-6:
+                    vx, vy, speed = 1.0, 0.0, 1.0
+                trail_len = (8 + min(16.0, speed * 0.03)) / speed
+                trail.position = xy
+                trail.x2, trail.y2 = sx - vx * trail_len, sy - vy * trail_len * 0.65
+                trail.opacity = 95 if is_enemy else 125
+            sh.position = xy
+            core.position = xy
+            flare.position = xy
+            flare.opacity = 90 if is_enemy else 130
+            set_depth(h, sy)
 
     def drop_projectile(self, proj):
         """Remove projectile visual."""
@@ -925,17 +948,27 @@ class Visuals:
         )
         self._power_handles[id(p)] = RenderHandle(ring2, ring1, orb, core, label)
 
-    def sync_powerup(self, p, shake: Vec2):
-        """Update powerup visual position."""
-        h = self._power_handles[id(p)]
-        ring2, ring1, orb, core, label = h.objs
-        sx, sy = to_iso(p.pos, shake)
-        ring2.x, ring2.y = sx, sy
-        ring1.x, ring1.y = sx, sy
-        orb.x, orb.y = sx, sy
-        core.x, core.y = sx, sy
-        label.x, label.y = sx, sy
-        self._set_depth(h, sy)
+    def sync_powerups(self, powerups, shake: Vec2):
+        """Ensure and update visuals for every powerup in one call."""
+        handles = self._power_handles
+        ensure = self.ensure_powerup
+        set_depth = self._set_depth
+        ox, oy = iso_origin(shake)
+        for p in powerups:
+            h = handles.get(id(p))
+            if h is None:
+                ensure(p)
+                h = handles[id(p)]
+            pos = p.pos
+            sy = (pos.x + pos.y) * ISO_SCALE_Y + oy
+            xy = ((pos.x - pos.y) * ISO_SCALE_X + ox, sy)
+            ring2, ring1, orb, core, label = h.objs
+            ring2.position = xy
+            ring1.position = xy
+            orb.position = xy
+            core.position = xy
+            label.x, label.y = xy
+            set_depth(h, sy)
 
     def drop_powerup(self, p):
         """Remove powerup visual."""